@@ -8,20 +8,35 @@ Handles LLM integration, agent coordination, and development tools.
 
 import logging
 import os
+import random
+import socket
 import sys
+import time
 
 # Add parent directory to path for imports (do this early so local imports work)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
+import functools
+import json
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable, ParamSpec, TypeVar
 from dotenv import load_dotenv
 
+import anyio
 import uvicorn
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel
 
 from typing import TYPE_CHECKING
 
@@ -101,25 +116,123 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global managers
-agent_manager: AgentManager | None = None
-llm_manager: LLMManager | None = None
-lsp_manager: LSPManager | None = None
-mcp_manager: MCPManager | None = None
-n8n_manager: N8NManager | None = None
-proxmox_manager: ProxmoxManager | None = None
-debug_manager: DebugManager | None = None
-coordinator: EnhancedAgentCoordinator | None = None
-tool_discovery: ToolDiscoveryManager | None = None
-git_manager: GitManager | None = None
+# Managers live on ``app.state`` rather than module globals so that each
+# worker initializes its own instances inside the lifespan handler.
+MANAGER_NAMES = (
+    "agent_manager",
+    "llm_manager",
+    "lsp_manager",
+    "mcp_manager",
+    "n8n_manager",
+    "proxmox_manager",
+    "debug_manager",
+    "coordinator",
+    "tool_discovery",
+    "git_manager",
+)
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def translate_errors(
+    message: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Log unexpected endpoint errors and re-raise them as HTTP 500.
+
+    ``message`` may reference the endpoint's keyword arguments, e.g.
+    ``"Error running agent {agent_type}"``. HTTPExceptions raised by the
+    endpoint itself pass through unchanged.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", message.format_map(kwargs), e)
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        return wrapper
+
+    return decorator
+
+
+def _get_manager(request: Request, name: str, label: str) -> Any:
+    """Return a manager from app.state, or 503 until startup has created it.
+
+    503 rather than 500 lets load balancers take the instance out of rotation
+    while it is still starting up or shutting down.
+    """
+    manager = getattr(request.app.state, name, None)
+    if manager is None:
+        raise HTTPException(status_code=503, detail=f"{label} not initialized")
+    return manager
+
+
+def get_agent_manager(request: Request) -> AgentManager:
+    manager: AgentManager = _get_manager(request, "agent_manager", "Agent manager")
+    return manager
+
+
+def get_llm_manager(request: Request) -> LLMManager:
+    manager: LLMManager = _get_manager(request, "llm_manager", "LLM manager")
+    return manager
+
+
+def get_lsp_manager(request: Request) -> LSPManager:
+    manager: LSPManager = _get_manager(request, "lsp_manager", "LSP manager")
+    return manager
+
+
+def get_mcp_manager(request: Request) -> MCPManager:
+    manager: MCPManager = _get_manager(request, "mcp_manager", "MCP manager")
+    return manager
+
+
+def get_n8n_manager(request: Request) -> N8NManager:
+    manager: N8NManager = _get_manager(request, "n8n_manager", "n8n manager")
+    return manager
+
+
+def get_proxmox_manager(request: Request) -> ProxmoxManager:
+    manager: ProxmoxManager = _get_manager(
+        request, "proxmox_manager", "Proxmox manager"
+    )
+    return manager
+
+
+def get_debug_manager(request: Request) -> DebugManager:
+    manager: DebugManager = _get_manager(request, "debug_manager", "Debug manager")
+    return manager
+
+
+def get_coordinator(request: Request) -> EnhancedAgentCoordinator:
+    manager: EnhancedAgentCoordinator = _get_manager(
+        request, "coordinator", "Coordinator"
+    )
+    return manager
+
+
+def get_tool_discovery(request: Request) -> ToolDiscoveryManager:
+    manager: ToolDiscoveryManager = _get_manager(
+        request, "tool_discovery", "Tool discovery"
+    )
+    return manager
+
+
+def get_git_manager(request: Request) -> GitManager:
+    manager: GitManager = _get_manager(request, "git_manager", "Git manager")
+    return manager
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager"""
-    global agent_manager, llm_manager, lsp_manager, mcp_manager, n8n_manager
-    global proxmox_manager, debug_manager, coordinator, tool_discovery, git_manager
-
     # Startup
     logger.info("Starting Open-Deep-Coder backend with enhanced capabilities...")
 
@@ -136,7 +249,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Initialize Proxmox manager conditionally
     enable_proxmox = os.getenv("PROXMOX_ENABLED", "false").lower() == "true"
-    proxmox_manager = None
+    proxmox_manager: ProxmoxManager | None = None
     if enable_proxmox:
         proxmox_manager = ProxmoxManager(
             host=os.getenv("PROXMOX_HOST", "localhost"),
@@ -164,7 +277,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         try:
             await proxmox_manager.initialize()
         except Exception as e:
-            logger.warning(f"Proxmox disabled (init failed): {e}")
+            logger.warning("Proxmox disabled (init failed): %s", e)
             proxmox_manager = None
 
     await debug_manager.initialize()
@@ -180,6 +293,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     }
     await tool_discovery.initialize(integrations)
 
+    app.state.agent_manager = agent_manager
+    app.state.llm_manager = llm_manager
+    app.state.lsp_manager = lsp_manager
+    app.state.mcp_manager = mcp_manager
+    app.state.n8n_manager = n8n_manager
+    app.state.proxmox_manager = proxmox_manager
+    app.state.debug_manager = debug_manager
+    app.state.coordinator = coordinator
+    app.state.tool_discovery = tool_discovery
+    app.state.git_manager = git_manager
+    app.state.health_cache = None
+
     logger.info("Enhanced backend startup complete")
 
     yield
@@ -204,6 +329,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if llm_manager:
         await llm_manager.cleanup()
 
+    for name in MANAGER_NAMES:
+        setattr(app.state, name, None)
+    app.state.health_cache = None
+
     logger.info("Backend shutdown complete")
 
 
@@ -215,32 +344,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Managers are unset until the lifespan startup has run
+for _name in MANAGER_NAMES:
+    setattr(app.state, _name, None)
+app.state.health_cache = None
+
 # include credentials router for server-backed credential storage
 app.include_router(credentials_router)
 
 
-def create_app() -> FastAPI:
-    """Return the FastAPI app instance (helper for tests)."""
-    return app
-
-
-def startup_for_tests() -> Callable[[], None]:
-    """Run application lifespan startup synchronously for tests.
-
-    Returns a callable to run shutdown/cleanup when tests complete.
-    """
-    cm = lifespan(app)
-    # Enter the async context to run startup
-    asyncio.run(cm.__aenter__())
-
-    def _shutdown() -> None:
-        try:
-            asyncio.run(cm.__aexit__(None, None, None))
-        except Exception:
-            pass
-
-    return _shutdown
-
 # Configure CORS from environment for safer defaults in production
 # Accepts a comma-separated list in ALLOWED_ORIGINS, otherwise falls back
 # to the local dev frontend host/port and tauri.
@@ -257,10 +369,15 @@ if allowed_env:
 else:
     allow_origins = default_origins
 
+# A wildcard origin makes browsers ignore credentials anyway, so only send
+# the credentials header when an explicit origin list is configured.
+allow_all_origins = "*" in allow_origins
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allow_origins,
-    allow_credentials=True,
+    # frozenset keeps the per-request origin membership check O(1)
+    allow_origins=frozenset(allow_origins),
+    allow_credentials=not allow_all_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -279,27 +396,50 @@ if os.path.isdir(frontend_dist):
     )
 
 
-# Health check endpoint
-@app.get("/health")
-async def health_check() -> dict:
-    """Health check endpoint"""
+# /health is polled by probes and orchestrators, so its payload is reused for
+# a few seconds. The jitter keeps workers from all refreshing at once.
+HEALTH_TTL = 3.0
+HEALTH_TTL_JITTER = 0.5
+
+
+def _build_health(state: Any) -> dict:
+    """Collect service readiness for the health payload"""
     return {
         "status": "healthy",
         "version": "0.1.0",
         "services": {
-            "llm_manager": llm_manager is not None and llm_manager.is_ready(),
-            "agent_manager": agent_manager is not None and agent_manager.is_ready(),
-            "lsp_manager": lsp_manager is not None and lsp_manager.is_initialized,
-            "mcp_manager": mcp_manager is not None and mcp_manager.is_initialized,
-            "n8n_manager": n8n_manager is not None and n8n_manager.is_initialized,
+            "llm_manager": (
+                state.llm_manager is not None and state.llm_manager.is_ready()
+            ),
+            "agent_manager": (
+                state.agent_manager is not None and state.agent_manager.is_ready()
+            ),
+            "lsp_manager": (
+                state.lsp_manager is not None and state.lsp_manager.is_initialized
+            ),
+            "mcp_manager": (
+                state.mcp_manager is not None and state.mcp_manager.is_initialized
+            ),
+            "n8n_manager": (
+                state.n8n_manager is not None and state.n8n_manager.is_initialized
+            ),
             "proxmox_manager": (
-                proxmox_manager is not None and proxmox_manager.is_initialized
+                state.proxmox_manager is not None
+                and state.proxmox_manager.is_initialized
+            ),
+            "debug_manager": (
+                state.debug_manager is not None and state.debug_manager.is_initialized
+            ),
+            "coordinator": (
+                state.coordinator is not None and state.coordinator.is_initialized
+            ),
+            "tool_discovery": (
+                state.tool_discovery is not None
+                and state.tool_discovery.is_initialized
+            ),
+            "git_manager": (
+                state.git_manager is not None and state.git_manager.is_ready()
             ),
-            "debug_manager": debug_manager is not None and debug_manager.is_initialized,
-            "coordinator": coordinator is not None and coordinator.is_initialized,
-            "tool_discovery": tool_discovery is not None
-            and tool_discovery.is_initialized,
-            "git_manager": git_manager is not None and git_manager.is_ready(),
         },
         "capabilities": {
             "enhanced_lsp": True,
@@ -313,94 +453,139 @@ async def health_check() -> dict:
     }
 
 
+# Health check endpoint
+@app.get("/health")
+async def health_check() -> dict:
+    """Health check endpoint"""
+    # (fresh_until, payload); reset whenever the lifespan starts or stops
+    cached: tuple[float, dict] | None = app.state.health_cache
+    now = time.monotonic()
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    try:
+        payload = _build_health(app.state)
+    except Exception as e:
+        if cached is None:
+            raise
+        # Serve the last good answer, flagged, rather than failing the probe
+        logger.warning("Health refresh failed, serving stale data: %s", e)
+        return {**cached[1], "status": "stale"}
+
+    fresh_until = now + HEALTH_TTL + random.uniform(0, HEALTH_TTL_JITTER)
+    app.state.health_cache = (fresh_until, payload)
+    return payload
+
+
 # LLM endpoints
 @app.get("/api/models", response_model=list[LLMModel])
-async def get_available_models() -> list[LLMModel]:
+async def get_available_models(
+    llm_manager: LLMManager = Depends(get_llm_manager)
+) -> list[LLMModel]:
     """Get available LLM models"""
-    if not llm_manager:
-        raise HTTPException(
-            status_code=500, detail="LLM manager not initialized"
-        )
-
     return await llm_manager.get_available_models()
 
 
-@app.post("/api/chat", response_model=ChatResponse)
-async def chat_completion(request: ChatRequest) -> ChatResponse:
-    """Handle chat completion request"""
-    if not llm_manager:
-        raise HTTPException(status_code=500, detail="LLM manager not initialized")
+# Stop reverse proxies from buffering server-sent events
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse_event(chunk: Any) -> str:
+    """Encode a chat chunk as a single server-sent event."""
+    if isinstance(chunk, BaseModel):
+        payload = chunk.model_dump_json()
+    else:
+        payload = json.dumps(chunk, default=str)
+    return f"data: {payload}\n\n"
 
+
+async def _sse_stream(response: Any) -> AsyncIterator[str]:
+    """Relay an LLM response to the client as server-sent events.
+
+    Streaming responses are async iterators of chunks (the same contract the
+    websocket handler relies on); anything else is sent as a single event.
+    """
     try:
-        response = await llm_manager.chat_completion(
-            messages=request.messages,
-            model=request.model,
-            stream=request.stream,
-            context=request.context,
-        )
-        return response
+        if hasattr(response, "__aiter__"):
+            async for chunk in response:
+                yield _sse_event(chunk)
+        else:
+            yield _sse_event(response)
     except Exception as e:
-        logger.error(f"Chat completion error: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+        # Headers are already sent, so report the failure in-band
+        logger.error("Chat stream error: %s", e)
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+
+@app.post("/api/chat", response_model=ChatResponse)
+@translate_errors("Chat completion error")
+async def chat_completion(
+    request: ChatRequest, llm_manager: LLMManager = Depends(get_llm_manager)
+) -> ChatResponse | StreamingResponse:
+    """Handle chat completion request"""
+    response = await llm_manager.chat_completion(
+        messages=request.messages,
+        model=request.model,
+        stream=request.stream,
+        context=request.context,
+    )
+    if request.stream:
+        return StreamingResponse(
+            _sse_stream(response),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+    return response
 
 
 # Agent endpoints
 @app.get("/api/agents/status", response_model=list[AgentStatus])
-async def get_agent_status() -> list[AgentStatus]:
+async def get_agent_status(
+    agent_manager: AgentManager = Depends(get_agent_manager)
+) -> list[AgentStatus]:
     """Get status of all agents"""
-    if not agent_manager:
-        raise HTTPException(status_code=500, detail="Agent manager not initialized")
-
     return await agent_manager.get_all_status()
 
 
 @app.post("/api/agents/{agent_type}/run")
-async def run_agent(agent_type: str, request: TaskRequest) -> dict:
+@translate_errors("Error running agent {agent_type}")
+async def run_agent(
+    agent_type: str,
+    request: TaskRequest,
+    agent_manager: AgentManager = Depends(get_agent_manager),
+) -> dict:
     """Run a specific agent with a task"""
-    if not agent_manager:
-        raise HTTPException(status_code=500, detail="Agent manager not initialized")
-
-    try:
-        result = await agent_manager.run_agent(
-            agent_type, request.task, request.context
-        )
-        return {"status": "started", "task_id": result}
-    except Exception as e:
-        logger.error(f"Error running agent {agent_type}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await agent_manager.run_agent(
+        agent_type, request.task, request.context
+    )
+    return {"status": "started", "task_id": result}
 
 
 @app.post("/api/agents/{agent_type}/stop")
-async def stop_agent(agent_type: str) -> dict:
+@translate_errors("Error stopping agent {agent_type}")
+async def stop_agent(
+    agent_type: str, agent_manager: AgentManager = Depends(get_agent_manager)
+) -> dict:
     """Stop a specific agent"""
-    if not agent_manager:
-        raise HTTPException(status_code=500, detail="Agent manager not initialized")
-
-    try:
-        await agent_manager.stop_agent(agent_type)
-        return {"status": "stopped"}
-    except Exception as e:
-        logger.error(f"Error stopping agent {agent_type}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    await agent_manager.stop_agent(agent_type)
+    return {"status": "stopped"}
 
 
 @app.post("/api/agents/stop-all")
-async def stop_all_agents() -> dict:
+@translate_errors("Error stopping all agents")
+async def stop_all_agents(
+    agent_manager: AgentManager = Depends(get_agent_manager)
+) -> dict:
     """Stop all running agents"""
-    if not agent_manager:
-        raise HTTPException(status_code=500, detail="Agent manager not initialized")
-
-    try:
-        await agent_manager.stop_all_agents()
-        return {"status": "all_stopped"}
-    except Exception as e:
-        logger.error(f"Error stopping all agents: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    await agent_manager.stop_all_agents()
+    return {"status": "all_stopped"}
 
 
 # WebSocket for real-time communication
 async def _handle_ws_message(websocket: WebSocket, data: dict) -> None:
     """Handle a single websocket message."""
+    agent_manager: AgentManager | None = app.state.agent_manager
+    llm_manager: LLMManager | None = app.state.llm_manager
     message_type = data.get("type")
 
     if message_type == "ping":
@@ -428,7 +613,7 @@ async def _handle_ws_message(websocket: WebSocket, data: dict) -> None:
                 await websocket.send_json({"type": "chat_error", "error": str(e)})
 
     else:
-        logger.warning(f"Unknown message type: {message_type}")
+        logger.warning("Unknown message type: %s", message_type)
 
 
 @app.websocket("/ws")
@@ -445,14 +630,17 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     except WebSocketDisconnect:
         logger.info("WebSocket connection closed")
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
         await websocket.close()
 
 
-# File system endpoints
+# File system endpoints. Blocking filesystem calls never run on the event loop:
+# plain ``def`` handlers go to Starlette's threadpool, and async ones hand the
+# work to a worker thread.
 @app.get("/api/files")
-async def list_files(path: str = ".") -> dict:
+def list_files(path: str = ".") -> dict:
     """List files and directories in a path"""
+    state = app.state
     import os
     from datetime import datetime
 
@@ -484,42 +672,42 @@ async def list_files(path: str = ".") -> dict:
             "version": "0.1.0",
             "services": {
                 "llm_manager": (
-                    llm_manager is not None and llm_manager.is_ready()
+                    state.llm_manager is not None and state.llm_manager.is_ready()
                 ),
                 "agent_manager": (
-                    agent_manager is not None
-                    and agent_manager.is_ready()
+                    state.agent_manager is not None
+                    and state.agent_manager.is_ready()
                 ),
                 "lsp_manager": (
-                    lsp_manager is not None and lsp_manager.is_initialized
+                    state.lsp_manager is not None and state.lsp_manager.is_initialized
                 ),
                 "mcp_manager": (
-                    mcp_manager is not None
-                    and mcp_manager.is_initialized
+                    state.mcp_manager is not None
+                    and state.mcp_manager.is_initialized
                 ),
                 "n8n_manager": (
-                    n8n_manager is not None
-                    and n8n_manager.is_initialized
+                    state.n8n_manager is not None
+                    and state.n8n_manager.is_initialized
                 ),
                 "proxmox_manager": (
-                    proxmox_manager is not None
-                    and proxmox_manager.is_initialized
+                    state.proxmox_manager is not None
+                    and state.proxmox_manager.is_initialized
                 ),
                 "debug_manager": (
-                    debug_manager is not None
-                    and debug_manager.is_initialized
+                    state.debug_manager is not None
+                    and state.debug_manager.is_initialized
                 ),
                 "coordinator": (
-                    coordinator is not None
-                    and coordinator.is_initialized
+                    state.coordinator is not None
+                    and state.coordinator.is_initialized
                 ),
                 "tool_discovery": (
-                    tool_discovery is not None
-                    and tool_discovery.is_initialized
+                    state.tool_discovery is not None
+                    and state.tool_discovery.is_initialized
                 ),
                 "git_manager": (
-                    git_manager is not None
-                    and git_manager.is_ready()
+                    state.git_manager is not None
+                    and state.git_manager.is_ready()
                 ),
             },
         }
@@ -538,264 +726,216 @@ async def list_files(path: str = ".") -> dict:
         # Non-text file
         raise HTTPException(status_code=400, detail="File is not a text file") from None
     except Exception as e:
-        logger.error(f"Error reading file: {e}")
+        logger.error("Error reading file: %s", e)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @app.post("/api/files/content")
+@translate_errors("Error in file operation")
 async def save_file_content(operation: FileOperation) -> dict:
     """Save file content"""
-    import os
+    return await anyio.to_thread.run_sync(_apply_file_operation, operation)
 
-    try:
-        abs_path = os.path.abspath(operation.path)
 
-        if operation.operation == "write":
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+def _apply_file_operation(operation: FileOperation) -> dict:
+    """Perform a write or delete file operation (blocking)"""
+    abs_path = os.path.abspath(operation.path)
 
-            with open(abs_path, "w", encoding="utf-8") as f:
-                f.write(operation.content or "")
+    if operation.operation == "write":
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
 
-            return {"status": "success", "path": abs_path}
+        with open(abs_path, "w", encoding="utf-8") as f:
+            f.write(operation.content or "")
 
-        elif operation.operation == "delete":
-            if os.path.exists(abs_path):
-                os.remove(abs_path)
-                return {"status": "deleted", "path": abs_path}
-            else:
-                raise HTTPException(status_code=404, detail="File not found")
+        return {"status": "success", "path": abs_path}
 
+    elif operation.operation == "delete":
+        if os.path.exists(abs_path):
+            os.remove(abs_path)
+            return {"status": "deleted", "path": abs_path}
         else:
-            raise HTTPException(status_code=400, detail="Invalid operation")
+            raise HTTPException(status_code=404, detail="File not found")
 
-    except Exception as e:
-        logger.error(f"Error in file operation: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    else:
+        raise HTTPException(status_code=400, detail="Invalid operation")
 
 
 # Enhanced LSP endpoints
 @app.get("/api/lsp/servers")
-async def get_lsp_servers() -> Any:
+async def get_lsp_servers(lsp_manager: LSPManager = Depends(get_lsp_manager)) -> Any:
     """Get status of all LSP servers"""
-    if not lsp_manager:
-        raise HTTPException(status_code=500, detail="LSP manager not initialized")
-
     return lsp_manager.get_server_status()
 
 
 @app.post("/api/lsp/completion")
-async def get_code_completion(request: dict) -> dict:
+@translate_errors("Error getting completions")
+async def get_code_completion(
+    request: dict, lsp_manager: LSPManager = Depends(get_lsp_manager)
+) -> dict:
     """Get code completion at position"""
-    if not lsp_manager:
-        raise HTTPException(status_code=500, detail="LSP manager not initialized")
-
-    try:
-        completions = await lsp_manager.get_completions(
-            request["file_path"], request["position"], request["language"]
-        )
-        return {"completions": completions}
-    except Exception as e:
-        logger.error(f"Error getting completions: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    completions = await lsp_manager.get_completions(
+        request["file_path"], request["position"], request["language"]
+    )
+    return {"completions": completions}
 
 
 @app.post("/api/lsp/hover")
-async def get_hover_info(request: dict) -> dict:
+@translate_errors("Error getting hover info")
+async def get_hover_info(
+    request: dict, lsp_manager: LSPManager = Depends(get_lsp_manager)
+) -> dict:
     """Get hover information at position"""
-    if not lsp_manager:
-        raise HTTPException(status_code=500, detail="LSP manager not initialized")
-
-    try:
-        hover_info = await lsp_manager.get_hover_info(
-            request["file_path"], request["position"], request["language"]
-        )
-        return {"hover_info": hover_info}
-    except Exception as e:
-        logger.error(f"Error getting hover info: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    hover_info = await lsp_manager.get_hover_info(
+        request["file_path"], request["position"], request["language"]
+    )
+    return {"hover_info": hover_info}
 
 
 # MCP endpoints
 @app.get("/api/mcp/servers")
-async def get_mcp_servers() -> Any:
+async def get_mcp_servers(mcp_manager: MCPManager = Depends(get_mcp_manager)) -> Any:
     """Get status of all MCP servers"""
-    if not mcp_manager:
-        raise HTTPException(status_code=500, detail="MCP manager not initialized")
-
     return mcp_manager.get_server_status()
 
 
 @app.get("/api/mcp/tools")
-async def get_mcp_tools() -> Any:
+async def get_mcp_tools(mcp_manager: MCPManager = Depends(get_mcp_manager)) -> Any:
     """Get available MCP tools"""
-    if not mcp_manager:
-        raise HTTPException(status_code=500, detail="MCP manager not initialized")
-
     return mcp_manager.get_available_tools()
 
 
 @app.post("/api/mcp/invoke")
-async def invoke_mcp_tool(request: dict) -> dict:
+@translate_errors("Error invoking MCP tool")
+async def invoke_mcp_tool(
+    request: dict, mcp_manager: MCPManager = Depends(get_mcp_manager)
+) -> dict:
     """Invoke an MCP tool"""
-    if not mcp_manager:
-        raise HTTPException(status_code=500, detail="MCP manager not initialized")
-
-    try:
-        result = await mcp_manager.invoke_tool(
-            request["server_id"], request["tool_name"], request.get("parameters", {})
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error invoking MCP tool: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await mcp_manager.invoke_tool(
+        request["server_id"], request["tool_name"], request.get("parameters", {})
+    )
+    return result
 
 
 # n8n endpoints
 @app.get("/api/n8n/workflows")
-async def get_n8n_workflows() -> Any:
+async def get_n8n_workflows(n8n_manager: N8NManager = Depends(get_n8n_manager)) -> Any:
     """Get n8n workflow status"""
-    if not n8n_manager:
-        raise HTTPException(status_code=500, detail="n8n manager not initialized")
-
     return n8n_manager.get_workflow_status()
 
 
 @app.post("/api/n8n/execute")
-async def execute_n8n_workflow(request: dict) -> dict:
+@translate_errors("Error executing n8n workflow")
+async def execute_n8n_workflow(
+    request: dict, n8n_manager: N8NManager = Depends(get_n8n_manager)
+) -> dict:
     """Execute an n8n workflow"""
-    if not n8n_manager:
-        raise HTTPException(status_code=500, detail="n8n manager not initialized")
-
-    try:
-        execution_id = await n8n_manager.execute_workflow(
-            request["workflow_id"], request.get("data", {})
-        )
-        return (
-            {"execution_id": execution_id}
-            if execution_id
-            else {"error": "Failed to start workflow"}
-        )
-    except Exception as e:
-        logger.error(f"Error executing n8n workflow: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    execution_id = await n8n_manager.execute_workflow(
+        request["workflow_id"], request.get("data", {})
+    )
+    return (
+        {"execution_id": execution_id}
+        if execution_id
+        else {"error": "Failed to start workflow"}
+    )
 
 
 @app.post("/api/n8n/git/commit")
-async def trigger_git_commit_workflow(request: dict) -> dict:
+@translate_errors("Error triggering git commit workflow")
+async def trigger_git_commit_workflow(
+    request: dict, n8n_manager: N8NManager = Depends(get_n8n_manager)
+) -> dict:
     """Trigger git commit workflow via n8n"""
-    if not n8n_manager:
-        raise HTTPException(status_code=500, detail="n8n manager not initialized")
-
-    try:
-        execution_id = await n8n_manager.trigger_git_commit_workflow(
-            request["repository_path"], request["commit_message"], request["files"]
-        )
-        return (
-            {"execution_id": execution_id}
-            if execution_id
-            else {"error": "Failed to trigger workflow"}
-        )
-    except Exception as e:
-        logger.error(f"Error triggering git commit workflow: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    execution_id = await n8n_manager.trigger_git_commit_workflow(
+        request["repository_path"], request["commit_message"], request["files"]
+    )
+    return (
+        {"execution_id": execution_id}
+        if execution_id
+        else {"error": "Failed to trigger workflow"}
+    )
 
 
 # Debug endpoints
 @app.get("/api/debug/sessions")
-async def get_debug_sessions() -> list[dict[str, Any]]:
+async def get_debug_sessions(
+    debug_manager: DebugManager = Depends(get_debug_manager)
+) -> list[dict[str, Any]]:
     """Get status of all debug sessions"""
-    if not debug_manager:
-        raise HTTPException(status_code=500, detail="Debug manager not initialized")
-
     return debug_manager.get_session_status()
 
 
 @app.post("/api/debug/start")
-async def start_debug_session(request: dict) -> dict[str, Any]:
+@translate_errors("Error starting debug session")
+async def start_debug_session(
+    request: dict, debug_manager: DebugManager = Depends(get_debug_manager)
+) -> dict[str, Any]:
     """Start a debug session"""
-    if not debug_manager:
-        raise HTTPException(status_code=500, detail="Debug manager not initialized")
-
-    try:
-        session_id = await debug_manager.start_debug_session(
-            request["file_path"], request["language"], request.get("config")
-        )
-        return (
-            {"session_id": session_id}
-            if session_id
-            else {"error": "Failed to start debug session"}
-        )
-    except Exception as e:
-        logger.error(f"Error starting debug session: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    session_id = await debug_manager.start_debug_session(
+        request["file_path"], request["language"], request.get("config")
+    )
+    return (
+        {"session_id": session_id}
+        if session_id
+        else {"error": "Failed to start debug session"}
+    )
 
 
 @app.post("/api/debug/breakpoint")
-async def set_breakpoint(request: dict) -> dict[str, Any]:
+@translate_errors("Error setting breakpoint")
+async def set_breakpoint(
+    request: dict, debug_manager: DebugManager = Depends(get_debug_manager)
+) -> dict[str, Any]:
     """Set a breakpoint"""
-    if not debug_manager:
-        raise HTTPException(status_code=500, detail="Debug manager not initialized")
-
-    try:
-        breakpoint_id = await debug_manager.set_breakpoint(
-            request["session_id"],
-            request["file_path"],
-            request["line"],
-            request.get("condition"),
-        )
-        return (
-            {"breakpoint_id": breakpoint_id}
-            if breakpoint_id
-            else {"error": "Failed to set breakpoint"}
-        )
-    except Exception as e:
-        logger.error(f"Error setting breakpoint: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    breakpoint_id = await debug_manager.set_breakpoint(
+        request["session_id"],
+        request["file_path"],
+        request["line"],
+        request.get("condition"),
+    )
+    return (
+        {"breakpoint_id": breakpoint_id}
+        if breakpoint_id
+        else {"error": "Failed to set breakpoint"}
+    )
 
 
 # Tool Discovery endpoints
 @app.get("/api/tools")
-async def get_available_tools(category: str | None = None) -> list[dict[str, Any]]:
+async def get_available_tools(
+    category: str | None = None,
+    tool_discovery: ToolDiscoveryManager = Depends(get_tool_discovery),
+) -> list[dict[str, Any]]:
     """Get all available tools"""
-    if not tool_discovery:
-        raise HTTPException(status_code=500, detail="Tool discovery not initialized")
-
     return tool_discovery.get_available_tools(category=category)
 
 
 @app.post("/api/tools/invoke")
-async def invoke_tool(request: dict) -> dict[str, Any]:
+@translate_errors("Error invoking tool")
+async def invoke_tool(
+    request: dict, tool_discovery: ToolDiscoveryManager = Depends(get_tool_discovery)
+) -> dict[str, Any]:
     """Invoke a tool capability"""
-    if not tool_discovery:
-        raise HTTPException(status_code=500, detail="Tool discovery not initialized")
-
-    try:
-        result = await tool_discovery.invoke_tool(
-            request["tool_id"], request["capability"], request.get("parameters", {})
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error invoking tool: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await tool_discovery.invoke_tool(
+        request["tool_id"], request["capability"], request.get("parameters", {})
+    )
+    return result
 
 
 @app.get("/api/tools/analytics")
-async def get_tool_analytics() -> dict[str, Any]:
+async def get_tool_analytics(
+    tool_discovery: ToolDiscoveryManager = Depends(get_tool_discovery)
+) -> dict[str, Any]:
     """Get tool usage analytics"""
-    if not tool_discovery:
-        raise HTTPException(status_code=500, detail="Tool discovery not initialized")
-
     return tool_discovery.get_usage_analytics()
 
 
 # Enhanced coordination endpoints
 @app.get("/api/coordination/status")
-async def get_coordination_status() -> dict[str, Any]:
+async def get_coordination_status(
+    coordinator: EnhancedAgentCoordinator = Depends(get_coordinator)
+) -> dict[str, Any]:
     """Get enhanced coordination system status"""
-    if not coordinator:
-        raise HTTPException(status_code=500, detail="Coordinator not initialized")
-
     return {
         "agents": coordinator.get_agent_status(),
         "metrics": coordinator.get_system_metrics(),
@@ -803,287 +943,229 @@ async def get_coordination_status() -> dict[str, Any]:
 
 
 @app.post("/api/coordination/task")
-async def submit_coordination_task(request: dict) -> dict[str, Any]:
+@translate_errors("Error submitting coordination task")
+async def submit_coordination_task(
+    request: dict, coordinator: EnhancedAgentCoordinator = Depends(get_coordinator)
+) -> dict[str, Any]:
     """Submit a task to the coordination system"""
-    if not coordinator:
-        raise HTTPException(status_code=500, detail="Coordinator not initialized")
-
-    try:
-        from backend.integrations.enhanced_coordination import TaskPriority
-
-        task_id = await coordinator.submit_task(
-            request["type"],
-            request["description"],
-            TaskPriority(request.get("priority", "normal")),
-            request.get("dependencies"),
-            request.get("prerequisites"),
-        )
-        return {"task_id": task_id}
-    except Exception as e:
-        logger.error(f"Error submitting coordination task: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    from backend.integrations.enhanced_coordination import TaskPriority
+
+    task_id = await coordinator.submit_task(
+        request["type"],
+        request["description"],
+        TaskPriority(request.get("priority", "normal")),
+        request.get("dependencies"),
+        request.get("prerequisites"),
+    )
+    return {"task_id": task_id}
 
 
 @app.post("/api/coordination/workflow")
-async def submit_coordination_workflow(request: dict) -> dict[str, Any]:
+@translate_errors("Error submitting coordination workflow")
+async def submit_coordination_workflow(
+    request: dict, coordinator: EnhancedAgentCoordinator = Depends(get_coordinator)
+) -> dict[str, Any]:
     """Submit a workflow to the coordination system"""
-    if not coordinator:
-        raise HTTPException(status_code=500, detail="Coordinator not initialized")
-
-    try:
-        workflow_id = await coordinator.submit_workflow(
-            request["name"], request["tasks"], request.get("metadata")
-        )
-        return {"workflow_id": workflow_id}
-    except Exception as e:
-        logger.error(f"Error submitting coordination workflow: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    workflow_id = await coordinator.submit_workflow(
+        request["name"], request["tasks"], request.get("metadata")
+    )
+    return {"workflow_id": workflow_id}
 
 
 # Git Integration endpoints (via MCP and n8n)
 @app.get("/api/git/status")
-async def git_status(repository_path: str = ".") -> dict[str, Any]:
+@translate_errors("Error getting git status")
+async def git_status(
+    repository_path: str = ".", mcp_manager: MCPManager = Depends(get_mcp_manager)
+) -> dict[str, Any]:
     """Get git status using MCP"""
-    if not mcp_manager:
-        raise HTTPException(status_code=500, detail="MCP manager not initialized")
-
-    try:
-        result = await mcp_manager.git_status(repository_path)
-        return result
-    except Exception as e:
-        logger.error(f"Error getting git status: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await mcp_manager.git_status(repository_path)
+    return result
 
 
 @app.post("/api/git/commit")
+@translate_errors("Error in git commit")
 async def git_commit(request: dict) -> dict[str, Any]:
     """Commit changes using MCP or n8n"""
+    mcp_manager: MCPManager | None = app.state.mcp_manager
+    n8n_manager: N8NManager | None = app.state.n8n_manager
     repository_path = request.get("repository_path", ".")
     commit_message = request["commit_message"]
     files = request.get("files")
     use_n8n = request.get("use_n8n", False)
 
-    try:
-        if use_n8n and n8n_manager:
-            # Use n8n workflow for git operations
-            execution_id = await n8n_manager.trigger_git_commit_workflow(
-                repository_path, commit_message, files or []
-            )
-            return {
-                "method": "n8n",
-                "execution_id": execution_id,
-                "status": "workflow_started" if execution_id else "failed",
-            }
-        elif mcp_manager:
-            # Use MCP for direct git operations
-            result = await mcp_manager.git_commit(
-                repository_path, commit_message, files
-            )
-            return {
-                "method": "mcp",
-                "result": result,
-                "status": "completed" if "error" not in result else "failed",
-            }
-        else:
-            raise HTTPException(status_code=500, detail="No git integration available")
-    except Exception as e:
-        logger.error(f"Error in git commit: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    if use_n8n and n8n_manager:
+        # Use n8n workflow for git operations
+        execution_id = await n8n_manager.trigger_git_commit_workflow(
+            repository_path, commit_message, files or []
+        )
+        return {
+            "method": "n8n",
+            "execution_id": execution_id,
+            "status": "workflow_started" if execution_id else "failed",
+        }
+    elif mcp_manager:
+        # Use MCP for direct git operations
+        result = await mcp_manager.git_commit(
+            repository_path, commit_message, files
+        )
+        return {
+            "method": "mcp",
+            "result": result,
+            "status": "completed" if "error" not in result else "failed",
+        }
+    else:
+        raise HTTPException(status_code=500, detail="No git integration available")
 
 
 @app.post("/api/git/push")
-async def git_push(request: dict) -> dict[str, Any]:
+@translate_errors("Error in git push")
+async def git_push(
+    request: dict, mcp_manager: MCPManager = Depends(get_mcp_manager)
+) -> dict[str, Any]:
     """Push changes using MCP"""
-    if not mcp_manager:
-        raise HTTPException(status_code=500, detail="MCP manager not initialized")
-
-    try:
-        result = await mcp_manager.git_push(
-            request.get("repository_path", "."),
-            request.get("remote", "origin"),
-            request.get("branch", "main"),
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error in git push: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await mcp_manager.git_push(
+        request.get("repository_path", "."),
+        request.get("remote", "origin"),
+        request.get("branch", "main"),
+    )
+    return result
 
 
 @app.post("/api/git/pull")
-async def git_pull(request: dict) -> dict[str, Any]:
+@translate_errors("Error in git pull")
+async def git_pull(
+    request: dict, mcp_manager: MCPManager = Depends(get_mcp_manager)
+) -> dict[str, Any]:
     """Pull changes using MCP"""
-    if not mcp_manager:
-        raise HTTPException(status_code=500, detail="MCP manager not initialized")
-
-    try:
-        result = await mcp_manager.git_pull(
-            request.get("repository_path", "."),
-            request.get("remote", "origin"),
-            request.get("branch", "main"),
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error in git pull: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await mcp_manager.git_pull(
+        request.get("repository_path", "."),
+        request.get("remote", "origin"),
+        request.get("branch", "main"),
+    )
+    return result
 
 
 @app.post("/api/git/setup-automation")
-async def setup_git_automation(request: dict) -> dict[str, Any]:
+@translate_errors("Error setting up git automation")
+async def setup_git_automation(
+    request: dict, n8n_manager: N8NManager = Depends(get_n8n_manager)
+) -> dict[str, Any]:
     """Setup automated git workflows using n8n"""
-    if not n8n_manager:
-        raise HTTPException(status_code=500, detail="n8n manager not initialized")
-
-    try:
-        workflow_id = await n8n_manager.setup_git_integration_workflow(
-            request["repository_path"]
-        )
-        return {
-            "workflow_id": workflow_id,
-            "status": "automation_setup" if workflow_id else "failed",
-        }
-    except Exception as e:
-        logger.error(f"Error setting up git automation: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    workflow_id = await n8n_manager.setup_git_integration_workflow(
+        request["repository_path"]
+    )
+    return {
+        "workflow_id": workflow_id,
+        "status": "automation_setup" if workflow_id else "failed",
+    }
 
 
 # Git endpoints
 @app.post("/api/git/authenticate")
-async def authenticate_git(request: dict) -> dict[str, Any]:
+@translate_errors("Git authentication error")
+async def authenticate_git(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Authenticate with Git credentials"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.authenticate(
-            request["username"], request["token"], request["email"]
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Git authentication error: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.authenticate(
+        request["username"], request["token"], request["email"]
+    )
+    return result
 
 
 @app.post("/api/git/repositories")
-async def create_git_repository(request: dict) -> dict[str, Any]:
+@translate_errors("Error creating repository")
+async def create_git_repository(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Create a new Git repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.create_repository(
-            request["name"],
-            request.get("description", ""),
-            request.get("private", False)
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error creating repository: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.create_repository(
+        request["name"],
+        request.get("description", ""),
+        request.get("private", False)
+    )
+    return result
 
 
 @app.post("/api/git/clone")
-async def clone_git_repository(request: dict) -> dict[str, Any]:
+@translate_errors("Error cloning repository")
+async def clone_git_repository(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Clone a Git repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.clone_repository(
-            request["url"], request["local_path"]
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error cloning repository: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.clone_repository(
+        request["url"], request["local_path"]
+    )
+    return result
 
 
 @app.post("/api/git/init")
-async def init_git_repository(request: dict) -> dict[str, Any]:
+@translate_errors("Error initializing repository")
+async def init_git_repository(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Initialize a new Git repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.init_repository(
-            request["local_path"], request["name"]
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error initializing repository: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.init_repository(
+        request["local_path"], request["name"]
+    )
+    return result
 
 
 @app.get("/api/git/status")
-async def get_git_status(repo_path: str) -> dict[str, Any]:
+@translate_errors("Error getting git status")
+async def get_git_status(
+    repo_path: str, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Get Git status for a repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.get_status(repo_path)
-        return result
-    except Exception as e:
-        logger.error(f"Error getting git status: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.get_status(repo_path)
+    return result
 
 
 @app.post("/api/git/commit")
-async def commit_git_changes(request: dict) -> dict[str, Any]:
+@translate_errors("Error committing changes")
+async def commit_git_changes(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Commit changes to Git repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.commit_changes(
-            request["repo_path"],
-            request["message"],
-            request.get("files")
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error committing changes: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.commit_changes(
+        request["repo_path"],
+        request["message"],
+        request.get("files")
+    )
+    return result
 
 
 @app.post("/api/git/push")
-async def push_git_changes(request: dict) -> dict[str, Any]:
+@translate_errors("Error pushing changes")
+async def push_git_changes(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Push changes to remote repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.push_changes(
-            request["repo_path"], request.get("branch", "main")
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error pushing changes: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.push_changes(
+        request["repo_path"], request.get("branch", "main")
+    )
+    return result
 
 
 @app.post("/api/git/pull")
-async def pull_git_changes(request: dict) -> dict[str, Any]:
+@translate_errors("Error pulling changes")
+async def pull_git_changes(
+    request: dict, git_manager: GitManager = Depends(get_git_manager)
+) -> dict[str, Any]:
     """Pull changes from remote repository"""
-    if not git_manager:
-        raise HTTPException(status_code=500, detail="Git manager not initialized")
-
-    try:
-        result = await git_manager.pull_changes(
-            request["repo_path"], request.get("branch", "main")
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error pulling changes: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await git_manager.pull_changes(
+        request["repo_path"], request.get("branch", "main")
+    )
+    return result
 
 
 # Development and testing endpoints
 @app.get("/api/dev/test-llm")
-async def test_llm() -> dict[str, Any]:
+async def test_llm(
+    llm_manager: LLMManager = Depends(get_llm_manager)
+) -> dict[str, Any]:
     """Test LLM integration"""
-    if not llm_manager:
-        raise HTTPException(status_code=500, detail="LLM manager not initialized")
-
     try:
         test_messages = [
             {
@@ -1099,13 +1181,19 @@ async def test_llm() -> dict[str, Any]:
             "tokens": response.tokens,
         }
     except Exception as e:
-        logger.error(f"LLM test error: {e}")
+        logger.error("LLM test error: %s", e)
         return {"status": "error", "error": str(e)}
 
 
 @app.get("/api/dev/test-integrations")
 async def test_integrations() -> dict[str, Any]:
     """Test all integrations"""
+    lsp_manager: LSPManager | None = app.state.lsp_manager
+    mcp_manager: MCPManager | None = app.state.mcp_manager
+    n8n_manager: N8NManager | None = app.state.n8n_manager
+    debug_manager: DebugManager | None = app.state.debug_manager
+    coordinator: EnhancedAgentCoordinator | None = app.state.coordinator
+    tool_discovery: ToolDiscoveryManager | None = app.state.tool_discovery
     results = {}
 
     # Test LSP
@@ -1114,7 +1202,7 @@ async def test_integrations() -> dict[str, Any]:
         results["lsp"] = {
             "status": "available",
             "servers_count": len(servers),
-            "active_servers": len([s for s in servers if s["state"] == "running"]),
+            "active_servers": sum(1 for s in servers if s["state"] == "running"),
         }
     else:
         results["lsp"] = {"status": "unavailable"}
@@ -1125,8 +1213,8 @@ async def test_integrations() -> dict[str, Any]:
         results["mcp"] = {
             "status": "available",
             "servers_count": len(server_status),
-            "connected_servers": len(
-                [s for s in server_status if s["state"] == "connected"]
+            "connected_servers": sum(
+                1 for s in server_status if s["state"] == "connected"
             ),
         }
     else:
@@ -1138,7 +1226,7 @@ async def test_integrations() -> dict[str, Any]:
         results["n8n"] = {
             "status": "available",
             "workflows_count": len(workflows),
-            "active_workflows": len([w for w in workflows if w["status"] == "active"]),
+            "active_workflows": sum(1 for w in workflows if w["status"] == "active"),
         }
     else:
         results["n8n"] = {"status": "unavailable"}
@@ -1179,169 +1267,175 @@ async def test_integrations() -> dict[str, Any]:
 
 # Proxmox container management endpoints
 @app.get("/api/containers/nodes")
-async def get_proxmox_nodes() -> dict:
+@translate_errors("Error getting Proxmox nodes")
+async def get_proxmox_nodes(
+    proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Get list of available Proxmox nodes"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        nodes = await proxmox_manager.get_nodes()
-        return {"nodes": nodes}
-    except Exception as e:
-        logger.error(f"Error getting Proxmox nodes: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    nodes = await proxmox_manager.get_nodes()
+    return {"nodes": nodes}
 
 
 @app.get("/api/containers/{node}/lxc")
-async def get_containers(node: str) -> dict:
+@translate_errors("Error getting containers")
+async def get_containers(
+    node: str, proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Get all containers on a node"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        containers = await proxmox_manager.get_containers(node)
-        return {"containers": [container.__dict__ for container in containers]}
-    except Exception as e:
-        logger.error(f"Error getting containers: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    containers = await proxmox_manager.get_containers(node)
+    return {"containers": [container.__dict__ for container in containers]}
 
 
 @app.get("/api/containers/{node}/qemu")
-async def get_vms(node: str) -> dict:
+@translate_errors("Error getting VMs")
+async def get_vms(
+    node: str, proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Get all VMs on a node"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        vms = await proxmox_manager.get_vms(node)
-        return {"vms": [vm.__dict__ for vm in vms]}
-    except Exception as e:
-        logger.error(f"Error getting VMs: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    vms = await proxmox_manager.get_vms(node)
+    return {"vms": [vm.__dict__ for vm in vms]}
 
 
 @app.post("/api/containers/{node}/lxc/{vmid}/start")
-async def start_container(node: str, vmid: int) -> dict:
+@translate_errors("Error starting container {vmid}")
+async def start_container(
+    node: str, vmid: int, proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Start a container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        result = await proxmox_manager.start_container(node, vmid)
-        return result
-    except Exception as e:
-        logger.error(f"Error starting container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await proxmox_manager.start_container(node, vmid)
+    return result
 
 
 @app.post("/api/containers/{node}/lxc/{vmid}/stop")
-async def stop_container(node: str, vmid: int) -> dict:
+@translate_errors("Error stopping container {vmid}")
+async def stop_container(
+    node: str, vmid: int, proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Stop a container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        result = await proxmox_manager.stop_container(node, vmid)
-        return result
-    except Exception as e:
-        logger.error(f"Error stopping container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await proxmox_manager.stop_container(node, vmid)
+    return result
 
 
 @app.post("/api/containers/{node}/lxc/{vmid}/restart")
-async def restart_container(node: str, vmid: int) -> dict:
+@translate_errors("Error restarting container {vmid}")
+async def restart_container(
+    node: str, vmid: int, proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Restart a container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        result = await proxmox_manager.restart_container(node, vmid)
-        return result
-    except Exception as e:
-        logger.error(f"Error restarting container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await proxmox_manager.restart_container(node, vmid)
+    return result
 
 
 @app.get("/api/containers/{node}/lxc/{vmid}/status")
-async def get_container_status(node: str, vmid: int) -> dict:
+@translate_errors("Error getting container {vmid} status")
+async def get_container_status(
+    node: str, vmid: int, proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager)
+) -> dict:
     """Get container status"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        status = await proxmox_manager.get_container_status(node, vmid)
-        return {"status": status.value}
-    except Exception as e:
-        logger.error(f"Error getting container {vmid} status: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    status = await proxmox_manager.get_container_status(node, vmid)
+    return {"status": status.value}
 
 
 @app.get("/api/containers/{node}/lxc/{vmid}/files")
-async def list_container_files(node: str, vmid: int, path: str = "/") -> dict:
+@translate_errors("Error listing files in container {vmid}")
+async def list_container_files(
+    node: str,
+    vmid: int,
+    path: str = "/",
+    proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager),
+) -> dict:
     """List files in container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        files = await proxmox_manager.list_container_files(node, vmid, path)
-        return {"files": [file.__dict__ for file in files]}
-    except Exception as e:
-        logger.error(f"Error listing files in container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    files = await proxmox_manager.list_container_files(node, vmid, path)
+    return {"files": [file.__dict__ for file in files]}
 
 
 @app.get("/api/containers/{node}/lxc/{vmid}/files/content")
-async def read_container_file(node: str, vmid: int, file_path: str) -> dict:
+@translate_errors("Error reading file {file_path} from container {vmid}")
+async def read_container_file(
+    node: str,
+    vmid: int,
+    file_path: str,
+    proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager),
+) -> dict:
     """Read file content from container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        content = await proxmox_manager.read_container_file(node, vmid, file_path)
-        return {"content": content}
-    except Exception as e:
-        logger.error(f"Error reading file {file_path} from container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    content = await proxmox_manager.read_container_file(node, vmid, file_path)
+    return {"content": content}
 
 
 @app.put("/api/containers/{node}/lxc/{vmid}/files/content")
+@translate_errors("Error writing file {file_path} to container {vmid}")
 async def write_container_file(
-    node: str, vmid: int, file_path: str, request: dict
+    node: str,
+    vmid: int,
+    file_path: str,
+    request: dict,
+    proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager),
 ) -> dict:
     """Write file content to container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
-
-    try:
-        result = await proxmox_manager.write_container_file(
-            node, vmid, file_path, request["content"]
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error writing file {file_path} to container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    result = await proxmox_manager.write_container_file(
+        node, vmid, file_path, request["content"]
+    )
+    return result
 
 
 @app.post("/api/containers/{node}/lxc/{vmid}/exec")
-async def execute_in_container(node: str, vmid: int, request: dict) -> dict:
+@translate_errors("Error executing command in container {vmid}")
+async def execute_in_container(
+    node: str,
+    vmid: int,
+    request: dict,
+    proxmox_manager: ProxmoxManager = Depends(get_proxmox_manager),
+) -> dict:
     """Execute command in container"""
-    if not proxmox_manager:
-        raise HTTPException(status_code=500, detail="Proxmox manager not initialized")
+    result = await proxmox_manager.execute_in_container(
+        node, vmid, request["command"]
+    )
+    return result
 
-    try:
-        result = await proxmox_manager.execute_in_container(
-            node, vmid, request["command"]
-        )
-        return result
-    except Exception as e:
-        logger.error(f"Error executing command in container {vmid}: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+
+def _listen_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket used by ``python -m backend.main``.
+
+    TCP_NODELAY on the listener is inherited by accepted connections on Linux,
+    so small websocket chat frames are not held back by Nagle's algorithm.
+    SO_REUSEPORT lets several processes bind the same port so the kernel can
+    spread incoming connections across them.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):  # not available on Windows
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
 
 
 # Main entry point
+# For development with auto-reload use ``uvicorn main:app --reload`` instead.
+# To scale out, start one process per core on the same BACKEND_PORT; with
+# SO_REUSEPORT the kernel load-balances new connections between them.
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "backend.main:app", host="127.0.0.1", port=8000, reload=True, log_level="info"
+    try:
+        import uvloop
+    except ImportError:  # uvloop does not support Windows
+        loop_impl = "asyncio"
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        loop_impl = "uvloop"
+
+    config = uvicorn.Config(
+        "backend.main:app",
+        loop=loop_impl,
+        http="httptools",
+        lifespan="on",
+        log_level="info",
+    )
+    uvicorn.Server(config).run(
+        sockets=[
+            _listen_socket(
+                os.getenv("BACKEND_HOST", "127.0.0.1"),
+                int(os.getenv("BACKEND_PORT", "8000")),
+            )
+        ]
     )
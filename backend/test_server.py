@@ -2,9 +2,21 @@
 Simple test server for Open-Deep-Coder backend
 """
 
+import asyncio
+import codecs
+import importlib.util
+import json
 import os
-from datetime import datetime
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import formatdate
+from functools import lru_cache
+from stat import S_ISDIR
 from typing import Any
+from urllib.parse import quote
 
 # Load environment variables
 try:
@@ -24,10 +36,19 @@ except ImportError:
                     os.environ[key] = value
 
 
+# tiktoken gives real BPE counts; without it, fall back to a word count
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+import aiofiles
+import anyio
 import httpx
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 
@@ -55,6 +76,8 @@ class ChatResponse(BaseModel):
     context: dict[str, Any] | None = None
 
 
+# Built only from server-side code (the provider probes and the mock list),
+# so instances are created with model_construct() and skip validation.
 class LLMModel(BaseModel):
     id: str
     name: str
@@ -64,84 +87,162 @@ class LLMModel(BaseModel):
     is_available: bool
 
 
+# Configuration
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+
+# Fixed tail of the mock chat reply; both inputs are set once at import
+_FALLBACK_SUFFIX = (
+    "This is a response from Open-Deep-Coder. "
+    f"Your Ollama server is at {OLLAMA_BASE_URL} and OpenRouter is "
+    f"{'configured' if OPENROUTER_API_KEY else 'not configured'}. "
+    "The system is working!"
+)
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    # Loading the BPE vocabulary is expensive, so do it once, on first use.
+    # It may need a download; if that fails, the cached None keeps later
+    # calls on the word count instead of retrying on every request.
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"Could not load tiktoken encoding, counting words instead: {e}")
+        return None
+
+
+@lru_cache(maxsize=1024)
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text.split())
+    return len(encoding.encode(text))
+
+
+# Shared HTTP client for Ollama/OpenRouter. Keep-alive pooling avoids a new
+# TCP/TLS handshake per request; HTTP/2 (when h2 is installed) multiplexes
+# concurrent OpenRouter calls over a single connection.
+def _new_httpx_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+        limits=httpx.Limits(
+            max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+        ),
+        http2=importlib.util.find_spec("h2") is not None,
+        headers={"User-Agent": "open-deep-coder/0.1"},
+    )
+
+
+# Created at import so handlers work without lifespan (ASGITransport and the
+# direct-call tests never run it); each startup replaces a client closed by
+# a previous shutdown.
+httpx_client = _new_httpx_client()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global httpx_client
+    if httpx_client.is_closed:
+        httpx_client = _new_httpx_client()
+    yield
+    await httpx_client.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Open-Deep-Coder API",
     description="Agentic IDE with multi-agent coding workflow",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware. Concrete methods/headers plus max_age let browsers cache
+# the preflight for a day instead of repeating it before each request.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:1420", "http://127.0.0.1:1420"],
+    allow_origins=frozenset({"http://localhost:1420", "http://127.0.0.1:1420"}),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=[
+        "authorization",
+        "content-type",
+        "if-none-match",
+        "x-title",
+        "http-referer",
+    ],
+    expose_headers=["etag", "last-modified", "x-file-path", "x-file-modified"],
+    max_age=86400,
 )
 
-# Configuration
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-
-# HTTP clients
-httpx_client = httpx.AsyncClient(timeout=30.0)
-
-
-# Mock data with real model detection
-async def get_available_models():
-    models = []
 
-    # Check Ollama models
+async def _probe_ollama():
     try:
         response = await httpx_client.get(f"{OLLAMA_BASE_URL}/api/tags")
-        if response.status_code == 200:
-            data = response.json()
-            for model_data in data.get("models", []):
-                models.append(
-                    LLMModel(
-                        id=model_data["name"],
-                        name=model_data["name"],
-                        provider="ollama",
-                        capabilities=["chat", "completion"],
-                        context_length=4096,
-                        is_available=True,
-                    )
-                )
+        if response.status_code != 200:
+            return []
+        data = response.json()
+        return [
+            LLMModel.model_construct(
+                id=model_data["name"],
+                name=model_data["name"],
+                provider="ollama",
+                capabilities=["chat", "completion"],
+                context_length=4096,
+                is_available=True,
+            )
+            for model_data in data.get("models", [])
+        ]
     except Exception as e:
         print(f"Could not connect to Ollama at {OLLAMA_BASE_URL}: {e}")
+        return []
 
-    # Check OpenRouter models if API key is available
-    if OPENROUTER_API_KEY:
-        try:
-            response = await httpx_client.get(
-                "https://openrouter.ai/api/v1/models",
-                headers={
-                    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                    "HTTP-Referer": "https://github.com/rcmiller01/openUI",
-                    "X-Title": "Open-Deep-Coder",
-                },
+
+async def _probe_openrouter():
+    try:
+        response = await httpx_client.get(
+            "https://openrouter.ai/api/v1/models",
+            headers={
+                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+                "HTTP-Referer": "https://github.com/rcmiller01/openUI",
+                "X-Title": "Open-Deep-Coder",
+            },
+        )
+        if response.status_code != 200:
+            return []
+        data = response.json()
+        return [
+            LLMModel.model_construct(
+                id=model_data["id"],
+                name=model_data.get("name", model_data["id"]),
+                provider="openrouter",
+                capabilities=["chat", "completion"],
+                context_length=model_data.get("context_length") or 4096,
+                is_available=True,
             )
-            if response.status_code == 200:
-                data = response.json()
-                for model_data in data.get("data", [])[:10]:  # Limit to first 10 models
-                    models.append(
-                        LLMModel(
-                            id=model_data["id"],
-                            name=model_data.get("name", model_data["id"]),
-                            provider="openrouter",
-                            capabilities=["chat", "completion"],
-                            context_length=model_data.get("context_length", 4096),
-                            is_available=True,
-                        )
-                    )
-        except Exception as e:
-            print(f"Could not connect to OpenRouter: {e}")
+            for model_data in data.get("data", [])[:10]  # Limit to first 10 models
+        ]
+    except Exception as e:
+        print(f"Could not connect to OpenRouter: {e}")
+        return []
+
+
+# Mock data with real model detection
+async def get_available_models():
+    # The providers are independent, so probe them concurrently
+    probes = [_probe_ollama()]
+    if OPENROUTER_API_KEY:
+        probes.append(_probe_openrouter())
+    results = await asyncio.gather(*probes)
+    models = [model for provider_models in results for model in provider_models]
 
     # Fallback mock models if no real ones available
     if not models:
         models = [
-            LLMModel(
+            LLMModel.model_construct(
                 id="mock-gpt-3.5-turbo",
                 name="GPT-3.5 Turbo (Mock)",
                 provider="openrouter",
@@ -149,7 +250,7 @@ async def get_available_models():
                 context_length=4096,
                 is_available=True,
             ),
-            LLMModel(
+            LLMModel.model_construct(
                 id="mock-llama2:7b",
                 name="Llama 2 7B (Mock)",
                 provider="ollama",
@@ -162,7 +263,34 @@ async def get_available_models():
     return models
 
 
-mock_models = []
+# Model list cache: (fetched_at, models, models_by_id). Refreshed every
+# MODELS_TTL seconds so models pulled into/removed from Ollama show up; the
+# lock makes sure a burst of cold requests triggers a single upstream fetch.
+# The id index is rebuilt with the list so chat lookups are a dict hit.
+MODELS_TTL = 60.0
+_models_cache: tuple[float, list[LLMModel], dict[str, LLMModel]] | None = None
+_models_lock = asyncio.Lock()
+
+
+async def _get_models_cache() -> tuple[float, list[LLMModel], dict[str, LLMModel]]:
+    global _models_cache
+    async with _models_lock:
+        now = time.monotonic()
+        if _models_cache and now - _models_cache[0] < MODELS_TTL:
+            return _models_cache
+        models = await get_available_models()
+        _models_cache = (now, models, {model.id: model for model in models})
+        return _models_cache
+
+
+async def get_cached_models() -> list[LLMModel]:
+    _, models, _ = await _get_models_cache()
+    return models
+
+
+async def get_cached_model(model_id: str) -> LLMModel | None:
+    _, _, models_by_id = await _get_models_cache()
+    return models_by_id.get(model_id)
 
 
 @app.get("/health")
@@ -176,10 +304,104 @@ async def health_check():
 
 @app.get("/api/models", response_model=list[LLMModel])
 async def get_available_models_endpoint():
-    global mock_models
-    if not mock_models:
-        mock_models = await get_available_models()
-    return mock_models
+    return await get_cached_models()
+
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _ollama_chunks(model_id, messages):
+    # Ollama streams newline-delimited JSON objects
+    async with httpx_client.stream(
+        "POST",
+        f"{OLLAMA_BASE_URL}/api/chat",
+        json={"model": model_id, "messages": messages, "stream": True},
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            data = json.loads(line)
+            done = data.get("done", False)
+            yield (
+                data.get("message", {}).get("content", ""),
+                data.get("done_reason", "stop") if done else None,
+                data.get("eval_count") if done else None,
+            )
+
+
+async def _openrouter_chunks(model_id, messages):
+    # OpenRouter speaks OpenAI-style SSE: "data: {...}" lines ending in [DONE]
+    async with httpx_client.stream(
+        "POST",
+        "https://openrouter.ai/api/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+            "HTTP-Referer": "https://github.com/rcmiller01/openUI",
+            "X-Title": "Open-Deep-Coder",
+            "Content-Type": "application/json",
+        },
+        json={
+            "model": model_id,
+            "messages": messages,
+            "max_tokens": 2000,
+            "temperature": 0.7,
+            "stream": True,
+        },
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            payload = line[len("data: ") :]
+            if payload == "[DONE]":
+                break
+            data = json.loads(payload)
+            choice = (data.get("choices") or [{}])[0]
+            yield (
+                choice.get("delta", {}).get("content") or "",
+                choice.get("finish_reason"),
+                (data.get("usage") or {}).get("total_tokens"),
+            )
+
+
+async def _sse_chat(model, messages, now):
+    chunks = _ollama_chunks if model.provider == "ollama" else _openrouter_chunks
+    parts = []
+    tokens = 0
+    finish_reason = "stop"
+    try:
+        async for delta, reason, usage in chunks(model.id, messages):
+            if delta:
+                parts.append(delta)
+                tokens += 1
+                message = ChatMessage(role="assistant", content=delta, model=model.id)
+                yield f"data: {message.model_dump_json()}\n\n"
+            if reason:
+                finish_reason = reason
+            if usage:
+                tokens = usage
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band
+        print(f"LLM stream failed: {e}")
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+        finish_reason = "error"
+
+    content = "".join(parts)
+    final = ChatResponse(
+        message=ChatMessage(
+            role="assistant",
+            content=content,
+            timestamp=now,
+            model=model.id,
+            tokens=tokens,
+        ),
+        model=model.id,
+        tokens=tokens,
+        finish_reason=finish_reason,
+        context={"provider": model.provider},
+    )
+    yield f"data: {final.model_dump_json()}\n\n"
 
 
 @app.post("/api/chat", response_model=ChatResponse)
@@ -187,20 +409,26 @@ async def chat_completion(request: ChatRequest):
     if not request.messages:
         raise HTTPException(status_code=400, detail="No messages provided")
 
+    now = datetime.now(timezone.utc)
     last_message = request.messages[-1].content
 
     # Try to use real LLM if model is specified and available
     if request.model:
-        global mock_models
-        if not mock_models:
-            mock_models = await get_available_models()
-
-        # Find the model
-        selected_model = None
-        for model in mock_models:
-            if model.id == request.model:
-                selected_model = model
-                break
+        selected_model = await get_cached_model(request.model)
+
+        can_stream = selected_model is not None and (
+            selected_model.provider == "ollama"
+            or (selected_model.provider == "openrouter" and OPENROUTER_API_KEY)
+        )
+        if request.stream and can_stream:
+            messages = [
+                {"role": msg.role, "content": msg.content} for msg in request.messages
+            ]
+            return StreamingResponse(
+                _sse_chat(selected_model, messages, now),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS,
+            )
 
         if selected_model:
             # Try real LLM call
@@ -222,19 +450,20 @@ async def chat_completion(request: ChatRequest):
                     if response.status_code == 200:
                         data = response.json()
                         response_content = data["message"]["content"]
+                        tokens = count_tokens(response_content)
 
                         response_message = ChatMessage(
                             role="assistant",
                             content=response_content,
-                            timestamp=datetime.now(),
+                            timestamp=now,
                             model=selected_model.id,
-                            tokens=len(response_content.split()),
+                            tokens=tokens,
                         )
 
                         return ChatResponse(
                             message=response_message,
                             model=selected_model.id,
-                            tokens=len(response_content.split()),
+                            tokens=tokens,
                             finish_reason="stop",
                             context={"provider": "ollama"},
                         )
@@ -264,23 +493,23 @@ async def chat_completion(request: ChatRequest):
                         data = response.json()
                         choice = data["choices"][0]
                         response_content = choice["message"]["content"]
+                        # Prefer the upstream count; only tokenize if it's missing
+                        tokens = data.get("usage", {}).get("total_tokens")
+                        if tokens is None:
+                            tokens = count_tokens(response_content)
 
                         response_message = ChatMessage(
                             role="assistant",
                             content=response_content,
-                            timestamp=datetime.now(),
+                            timestamp=now,
                             model=selected_model.id,
-                            tokens=data.get("usage", {}).get(
-                                "total_tokens", len(response_content.split())
-                            ),
+                            tokens=tokens,
                         )
 
                         return ChatResponse(
                             message=response_message,
                             model=selected_model.id,
-                            tokens=data.get("usage", {}).get(
-                                "total_tokens", len(response_content.split())
-                            ),
+                            tokens=tokens,
                             finish_reason=choice.get("finish_reason", "stop"),
                             context={"provider": "openrouter"},
                         )
@@ -290,51 +519,105 @@ async def chat_completion(request: ChatRequest):
                 # Fall through to mock response
 
     # Fallback to mock response
-    response_content = f"I understand you said: '{last_message}'. This is a response from Open-Deep-Coder. Your Ollama server is at {OLLAMA_BASE_URL} and OpenRouter is {'configured' if OPENROUTER_API_KEY else 'not configured'}. The system is working!"
+    response_content = f"I understand you said: '{last_message}'. {_FALLBACK_SUFFIX}"
+    tokens = count_tokens(response_content)
 
     response_message = ChatMessage(
         role="assistant",
         content=response_content,
-        timestamp=datetime.now(),
+        timestamp=now,
         model=request.model or "mock-model",
-        tokens=len(response_content.split()),
+        tokens=tokens,
     )
 
     return ChatResponse(
         message=response_message,
         model=request.model or "mock-model",
-        tokens=len(response_content.split()),
+        tokens=tokens,
         finish_reason="stop",
         context={"provider": "mock"},
     )
 
 
+def _os_error_to_http(e: OSError, not_found: str) -> HTTPException:
+    # Map the filesystem's own answer to a status instead of prechecking
+    if isinstance(e, (FileNotFoundError, NotADirectoryError)):
+        return HTTPException(status_code=404, detail=not_found)
+    if isinstance(e, IsADirectoryError):
+        return HTTPException(status_code=400, detail="Path is a directory")
+    if isinstance(e, PermissionError):
+        return HTTPException(status_code=403, detail="Permission denied")
+    return HTTPException(status_code=500, detail=str(e))
+
+
+# Directory listings cached per path for FILES_TTL seconds, so the editor's
+# polling collapses to one scan; an entry is also dropped as soon as the
+# directory's own mtime changes (a child was added, removed or renamed).
+# The keys are client-supplied paths, so expired entries are pruned on every
+# insert and at most FILES_CACHE_MAX are kept (oldest evicted first).
+FILES_TTL = 2.0
+FILES_CACHE_MAX = 256
+_files_cache: dict[str, tuple[float, int, list[dict[str, Any]]]] = {}
+_files_cache_lock = threading.Lock()
+
+
+def _store_listing(path: str, now: float, mtime: int, items: list) -> None:
+    # list_files runs in the threadpool, so guard the prune/evict/insert
+    with _files_cache_lock:
+        for key, (fetched_at, _, _) in list(_files_cache.items()):
+            if now - fetched_at >= FILES_TTL:
+                del _files_cache[key]
+        _files_cache.pop(path, None)
+        while len(_files_cache) >= FILES_CACHE_MAX:
+            del _files_cache[next(iter(_files_cache))]
+        _files_cache[path] = (now, mtime, items)
+
+
+# Plain ``def`` so Starlette runs the blocking directory scan in its threadpool
+# instead of stalling the event loop.
 @app.get("/api/files")
-async def list_files(path: str = "."):
+def list_files(path: str = "."):
     try:
         abs_path = os.path.abspath(path)
-        if not os.path.exists(abs_path):
-            raise HTTPException(status_code=404, detail="Path not found")
+        dir_stat = os.stat(abs_path)
+        if not S_ISDIR(dir_stat.st_mode):
+            raise HTTPException(status_code=400, detail="Path is not a directory")
+        dir_mtime = dir_stat.st_mtime_ns
+
+        now = time.monotonic()
+        cached = _files_cache.get(abs_path)
+        if cached and now - cached[0] < FILES_TTL and cached[1] == dir_mtime:
+            return cached[2]
 
         items = []
-        for item in os.listdir(abs_path):
-            item_path = os.path.join(abs_path, item)
-            stat = os.stat(item_path)
-
-            items.append(
-                {
-                    "path": item_path,
-                    "name": item,
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime),
-                    "is_directory": os.path.isdir(item_path),
-                    "permissions": (
-                        ["read", "write"] if os.access(item_path, os.W_OK) else ["read"]
-                    ),
-                }
-            )
+        # scandir yields type info with each entry, saving a stat per child
+        with os.scandir(abs_path) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed (or a dangling symlink) since the scan started
+                    continue
+
+                items.append(
+                    {
+                        "path": entry.path,
+                        "name": entry.name,
+                        "size": stat.st_size,
+                        "modified": datetime.fromtimestamp(stat.st_mtime),
+                        "is_directory": entry.is_dir(),
+                        "permissions": (
+                            ["read", "write"]
+                            if os.access(entry.path, os.W_OK)
+                            else ["read"]
+                        ),
+                    }
+                )
 
+        _store_listing(abs_path, now, dir_mtime, items)
         return items
+    except OSError as e:
+        raise _os_error_to_http(e, "Path not found") from e
     except Exception as e:
         # If an HTTPException was raised intentionally, re-raise it so the
         # correct status code is returned instead of wrapping it as 500.
@@ -343,26 +626,86 @@ async def list_files(path: str = "."):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.get("/api/files/content")
-async def get_file_content(path: str):
-    try:
-        abs_path = os.path.abspath(path)
-        if not os.path.exists(abs_path) or os.path.isdir(abs_path):
-            raise HTTPException(status_code=404, detail="File not found")
+# Files larger than this are streamed as plain text instead of being loaded
+# into memory and wrapped in JSON.
+LARGE_FILE_THRESHOLD = 1_000_000
+STREAM_CHUNK_SIZE = 64 * 1024
 
-        with open(abs_path, encoding="utf-8") as f:
-            content = f.read()
 
-        stat = os.stat(abs_path)
+async def _aiter_file(f, decoder, first: bytes) -> AsyncIterator[bytes]:
+    # ``first`` was already validated before the response started; later
+    # chunks go through the same incremental decoder, so non-UTF-8 bytes
+    # further in abort the stream instead of reaching the editor.
+    try:
+        yield first
+        while chunk := await f.read(STREAM_CHUNK_SIZE):
+            decoder.decode(chunk)
+            yield chunk
+        decoder.decode(b"", final=True)
+    finally:
+        await f.close()
+
 
-        return {
-            "path": abs_path,
-            "content": content,
-            "encoding": "utf-8",
-            "modified": datetime.fromtimestamp(stat.st_mtime),
+@app.get("/api/files/content")
+async def get_file_content(path: str, if_none_match: str | None = Header(default=None)):
+    try:
+        abs_path = os.path.abspath(path)
+        # A single stat serves the directory check, the ETag and the size
+        # decision; no separate exists() precheck.
+        stat = await anyio.to_thread.run_sync(os.stat, abs_path)
+        if S_ISDIR(stat.st_mode):
+            raise IsADirectoryError(abs_path)
+
+        # Weak validator from the stat we already have: unchanged files are
+        # answered with 304 without opening them.
+        etag = f'W/"{stat.st_mtime_ns}-{stat.st_size}"'
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
         }
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+
+        if stat.st_size > LARGE_FILE_THRESHOLD:
+            # Open and check the first chunk before responding, so open errors
+            # and binary files still map to a status code like small files do
+            f = await aiofiles.open(abs_path, "rb")
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            try:
+                first = await f.read(STREAM_CHUNK_SIZE)
+                decoder.decode(first)
+            except BaseException:
+                await f.close()
+                raise
+            # The body is bare text, so carry the JSON path's "path" and
+            # "modified" fields in headers (path percent-encoded, as header
+            # values must be latin-1)
+            headers["X-File-Path"] = quote(abs_path)
+            headers["X-File-Modified"] = datetime.fromtimestamp(
+                stat.st_mtime
+            ).isoformat()
+            return StreamingResponse(
+                _aiter_file(f, decoder, first),
+                media_type="text/plain; charset=utf-8",
+                headers=headers,
+            )
+
+        async with aiofiles.open(abs_path, encoding="utf-8") as f:
+            content = await f.read()
+
+        return ORJSONResponse(
+            {
+                "path": abs_path,
+                "content": content,
+                "encoding": "utf-8",
+                "modified": datetime.fromtimestamp(stat.st_mtime),
+            },
+            headers=headers,
+        )
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File is not a text file")
+    except OSError as e:
+        raise _os_error_to_http(e, "File not found") from e
     except Exception as e:
         # Preserve deliberately raised HTTPExceptions
         if isinstance(e, HTTPException):
@@ -371,24 +714,21 @@ async def get_file_content(path: str):
 
 
 if __name__ == "__main__":
-    import atexit
-
-    # Cleanup HTTP client on exit
-    def cleanup():
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(httpx_client.aclose())
-            else:
-                asyncio.run(httpx_client.aclose())
-        except Exception as e:
-            # best-effort: log and continue cleanup
-            print(f"Error closing httpx client: {e}")
-
-    atexit.register(cleanup)
+    # uvloop + httptools are pulled in by uvicorn[standard]; uvloop has no
+    # Windows build, so fall back to the stock asyncio loop there.
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        loop_impl = "asyncio"
+    else:
+        loop_impl = "uvloop"
 
     uvicorn.run(
-        "test_server:app", host="127.0.0.1", port=8000, reload=True, log_level="info"
+        "test_server:app",
+        host="127.0.0.1",
+        port=8000,
+        loop=loop_impl,
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+        log_level="info",
     )
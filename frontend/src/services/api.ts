@@ -169,6 +169,17 @@ class ApiClient {
         }
         throw new Error(`HTTP ${response.status}: ${response.statusText}`);
       }
+      // Large files are streamed back as plain text rather than JSON
+      if (response.headers.get('content-type')?.startsWith('text/plain')) {
+        // Path and mtime come from headers so this matches the JSON shape
+        const filePath = response.headers.get('x-file-path');
+        return {
+          path: filePath ? decodeURIComponent(filePath) : path,
+          content: await response.text(),
+          encoding: 'utf-8',
+          modified: response.headers.get('x-file-modified') ?? '',
+        };
+      }
       return await response.json();
     } catch (error) {
       console.error('Error getting file content:', error);
@@ -10,6 +10,7 @@ __author__ = "rcmiller01"
 
 from .math_ops import (
     add,
+    are_prime,
     divide,
     factorial,
     is_prime,
@@ -20,6 +21,7 @@ from .math_ops import (
 
 __all__ = [
     "add",
+    "are_prime",
     "divide",
     "factorial",
     "is_prime",
@@ -4,6 +4,10 @@ This module provides basic mathematical operations as an example
 of the Open-Deep-Coder workflow implementation.
 """
 
+import math
+from collections.abc import Iterable
+from functools import lru_cache
+
 Number = int | float
 
 
@@ -131,13 +135,12 @@ def factorial(n: int) -> int:
     if n < 0:
         raise ValueError("Factorial is only defined for non-negative integers")
 
-    if n == 0 or n == 1:
-        return 1
+    return _factorial_cached(n)
 
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+
+@lru_cache(maxsize=256)
+def _factorial_cached(n: int) -> int:
+    return math.factorial(n)
 
 
 def is_prime(n: int) -> bool:
@@ -147,7 +150,8 @@ def is_prime(n: int) -> bool:
         n: Integer to check
 
     Returns:
-        True if n is prime, False otherwise
+        True if n is prime, False otherwise. Exact below 3.3e24; above that
+        the Baillie-PSW test is used, which has no known counterexample.
 
     Raises:
         TypeError: If n is not an integer
@@ -163,15 +167,131 @@ def is_prime(n: int) -> bool:
     if not isinstance(n, int):
         raise TypeError("Prime check is only defined for integers")
 
+    return _is_prime_cached(n)
+
+
+# Miller-Rabin with the first 13 primes as witnesses is deterministic below
+# psi_13 (itself a strong pseudoprime to all of them); from there on a strong
+# Lucas test is added, making the check Baillie-PSW.
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_DETERMINISTIC_LIMIT = 3317044064679887385961981
+_SMALL_PRIMES = frozenset(_MR_WITNESSES)
+
+
+def _jacobi(a: int, n: int) -> int:
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _half_mod(x: int, n: int) -> int:
+    # x / 2 mod odd n
+    x %= n
+    return (x + n) // 2 if x % 2 else x // 2
+
+
+def _is_strong_lucas_prp(n: int) -> bool:
+    # Selfridge's method A: first D in 5, -7, 9, -11, ... with (D/n) = -1
+    if math.isqrt(n) ** 2 == n:
+        return False
+    D = 5
+    while (j := _jacobi(D, n)) != -1:
+        if j == 0 and D % n:
+            return False  # D shares a factor with n
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    # n + 1 = d * 2**s with d odd; walk d's bits to get U_d, V_d and Q**d
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    U, V, Qk = 1, P, Q
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = _half_mod(P * U + V, n), _half_mod(D * U + P * V, n)
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _is_prime_cached(n: int) -> bool:
     if n < 2:
         return False
-    if n == 2:
+    if n in _SMALL_PRIMES:
         return True
-    if n % 2 == 0:
+    if any(n % p == 0 for p in _MR_WITNESSES):
         return False
 
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
+    # n - 1 = d * 2**s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in _MR_WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
-    return True
+    return n < _MR_DETERMINISTIC_LIMIT or _is_strong_lucas_prp(n)
+
+
+_SIEVE_LIMIT = 10**7
+
+
+def are_prime(ns: Iterable[int]) -> list[bool]:
+    """Check a batch of numbers for primality with a single sieve.
+
+    Args:
+        ns: Integers to check
+
+    Returns:
+        A list of booleans, True where the corresponding number is prime
+
+    Raises:
+        TypeError: If any element is not an integer
+
+    Examples:
+        >>> are_prime([2, 4, 7, 9])
+        [True, False, True, False]
+        >>> are_prime([])
+        []
+    """
+    ns = list(ns)
+    if not all(isinstance(n, int) for n in ns):
+        raise TypeError("Prime check is only defined for integers")
+    # The sieve covers values up to _SIEVE_LIMIT; anything larger goes through
+    # is_prime so one huge value can't blow up the allocation
+    limit = min(max(ns, default=0), _SIEVE_LIMIT)
+    if limit < 2:
+        return [False] * len(ns)
+
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit + 1, i)))
+    return [
+        _is_prime_cached(n) if n > limit else n >= 2 and bool(sieve[n]) for n in ns
+    ]
@@ -4,9 +4,31 @@ Planner Output Template (YAML block).
 """
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import List, Dict
-from datetime import datetime
+from datetime import datetime, timezone
+
+import yaml
+
+# libyaml's C emitter when PyYAML was built with it, pure Python otherwise
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+class _FlowList(list[str]):
+    """A list emitted inline (``[a, b]``), as the planner template shows steps."""
+
+
+class _PlanDumper(_YAML_DUMPER):  # type: ignore[misc,valid-type]
+    pass
+
+
+_PlanDumper.add_representer(
+    _FlowList,
+    lambda dumper, data: dumper.represent_sequence(
+        "tag:yaml.org,2002:seq", data, flow_style=True
+    ),
+)
 
 
 @dataclass
@@ -19,31 +41,47 @@ class Task:
 
 
 def _yaml_block(cycle: int, milestone: str, tasks: List[Task]) -> str:
-    # Minimal YAML emission to avoid new deps
-    lines: List[str] = []
-    lines.append(f"cycle: {cycle}")
-    lines.append(f"milestone: {milestone}")
-    lines.append("tasks:")
-    for t in tasks:
-        lines.append(f"  - id: {t.id}")
-        lines.append(f"    title: {t.title}")
-        lines.append(f"    rationale: {t.rationale}")
-        steps_inline = ", ".join(t.steps)
-        lines.append(f"    steps: [{steps_inline}]")
-        lines.append("    acceptance:")
-        for k, v in t.acceptance.items():
-            lines.append(f"      - {k}: {v}")
-    return "\n".join(lines) + "\n"
+    # Shape follows the Planner Output Template in agents.md: steps inline,
+    # acceptance as a list of single-key items
+    payload = {
+        "cycle": cycle,
+        "milestone": milestone,
+        "tasks": [
+            {
+                "id": t.id,
+                "title": t.title,
+                "rationale": t.rationale,
+                "steps": _FlowList(t.steps),
+                "acceptance": [{k: v} for k, v in t.acceptance.items()],
+            }
+            for t in tasks
+        ],
+    }
+    # allow_unicode keeps non-ASCII prompts readable in plan.md
+    block: str = yaml.dump(
+        payload,
+        Dumper=_PlanDumper,
+        sort_keys=False,
+        default_flow_style=False,
+        allow_unicode=True,
+    )
+    return block
 
 
 def append_plan_md(plan_path: str = "plan.md", *, cycle: int, milestone: str, tasks: List[Task]) -> None:
-    banner = f"\n\n<!-- Planner update: {datetime.utcnow().isoformat()}Z -->\n\n"
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    banner = f"\n\n<!-- Planner update: {now} -->\n\n"
     yaml_block = _yaml_block(cycle, milestone, tasks)
-    with open(plan_path, "a", encoding="utf-8") as f:
-        f.write(banner)
-        f.write("```yaml\n")
-        f.write(yaml_block)
-        f.write("```\n")
+    payload = f"{banner}```yaml\n{yaml_block}```\n".encode("utf-8")
+    # One O_APPEND write per update so concurrent planners can't interleave
+    fd = os.open(plan_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            # os.write may be short (disk full, signal); finish the remainder
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 def default_breakdown(prompt: str) -> List[Task]:
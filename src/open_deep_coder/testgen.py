@@ -6,19 +6,24 @@ and asserts availability, so it is always green and demonstrates the capability.
 """
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Iterable
 
 
 def _discover_modules(src_root: str = "src") -> Iterable[str]:
-    root = Path(src_root)
-    if not root.is_dir():
+    if not os.path.isdir(src_root):
         return
-    for py in root.rglob("*.py"):
-        if py.name == "__init__.py":
-            continue
-        mod = py.relative_to(root).with_suffix("")
-        yield ".".join(("src",) + tuple(mod.parts))
+    # Iterative scandir walk: no Path objects or glob matching per entry
+    stack = [src_root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                    rel = os.path.relpath(entry.path, src_root)
+                    yield "src." + rel[:-3].replace(os.sep, ".")
 
 
 def generate_smoke_tests(tests_dir: str = "tests") -> str:
@@ -40,5 +45,5 @@ def generate_smoke_tests(tests_dir: str = "tests") -> str:
         "        importlib.import_module(name)",
     ]
 
-    outfile.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    outfile.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
     return str(outfile)
@@ -7,180 +7,279 @@ and tool discovery capabilities.
 """
 
 import asyncio
+import io
+import sys
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
+import ijson
+
+BASE_URL = "http://127.0.0.1:8000"
+
+# One client for the whole run so every probe reuses the same keep-alive
+# connection instead of paying a new connect per request.
+_client: httpx.AsyncClient | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client if it was created"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def report_health(health_data: dict, out: io.StringIO) -> None:
+    """Print backend status, services and capabilities"""
+    print(f"✅ Backend Status: {health_data['status']}", file=out)
+    print("📊 Services:", file=out)
+    for service, status in health_data.get("services", {}).items():
+        status_icon = "✅" if status else "❌"
+        print(f"   {status_icon} {service}: {status}", file=out)
+
+    print("🎯 Enhanced Capabilities:", file=out)
+    for capability, enabled in health_data.get("capabilities", {}).items():
+        cap_icon = "✅" if enabled else "❌"
+        print(f"   {cap_icon} {capability}: {enabled}", file=out)
+
+
+def report_integrations(integrations: dict, out: io.StringIO) -> None:
+    """Print the status of each integration"""
+    print("📊 Integration Status:", file=out)
+    for integration, data in integrations.items():
+        status_icon = "✅" if data.get("status") == "available" else "❌"
+        print(
+            f"   {status_icon} {integration.upper()}: {data.get('status', 'unknown')}",
+            file=out,
+        )
+
+        # Show detailed info for available integrations
+        if data.get("status") == "available":
+            if "servers_count" in data:
+                print(f"      📈 Servers: {data['servers_count']}", file=out)
+            if "tools_count" in data:
+                print(f"      🔧 Tools: {data['tools_count']}", file=out)
+            if "workflows_count" in data:
+                print(f"      🔄 Workflows: {data['workflows_count']}", file=out)
+            if "sessions_count" in data:
+                print(f"      🐛 Debug Sessions: {data['sessions_count']}", file=out)
+            if "agents_count" in data:
+                print(f"      🤖 Agents: {data['agents_count']}", file=out)
+
+
+def report_tools(categories: dict[str, list[str]], out: io.StringIO) -> None:
+    """Print discovered tools grouped by category"""
+    total = sum(len(names) for names in categories.values())
+    print(f"✅ Found {total} tools", file=out)
+
+    for category, tool_names in categories.items():
+        print(f"   📦 {category.upper()}: {len(tool_names)} tools", file=out)
+        for tool_name in tool_names[:3]:  # Show first 3 tools
+            print(f"      - {tool_name}", file=out)
+        if len(tool_names) > 3:
+            print(f"      ... and {len(tool_names) - 3} more", file=out)
+
+
+def report_analytics(analytics: dict, out: io.StringIO) -> None:
+    """Print tool usage analytics"""
+    print("✅ Tool Analytics:", file=out)
+    print(f"   📊 Total Tools: {analytics.get('total_tools', 0)}", file=out)
+    print(f"   🎯 Total Usages: {analytics.get('total_usages', 0)}", file=out)
+    print("   📈 By Category:", file=out)
+    for category, count in analytics.get("by_category", {}).items():
+        print(f"      - {category}: {count}", file=out)
+
+
+def report_coordination(coordination: dict, out: io.StringIO) -> None:
+    """Print coordinator agents and task metrics"""
+    agents = coordination.get("agents", [])
+    metrics = coordination.get("metrics", {})
+
+    print("✅ Enhanced Coordination Status:", file=out)
+    print(f"   🤖 Agents: {len(agents)}", file=out)
+    print("   📊 System Metrics:", file=out)
+    print(f"      - Total Tasks: {metrics.get('total_tasks', 0)}", file=out)
+    print(f"      - Completed: {metrics.get('completed_tasks', 0)}", file=out)
+    print(f"      - Running: {metrics.get('running_tasks', 0)}", file=out)
+    print(f"      - Success Rate: {metrics.get('success_rate', 0):.2%}", file=out)
+
+
+def report_llm(llm_test: dict, out: io.StringIO) -> None:
+    """Print the result of the backend's LLM self-test"""
+    if llm_test.get("status") == "success":
+        print("✅ LLM Test Successful:", file=out)
+        print(f"   🤖 Model: {llm_test.get('model_used', 'unknown')}", file=out)
+        print(f"   💬 Response: {llm_test.get('response', '')[:100]}...", file=out)
+        print(f"   🔢 Tokens: {llm_test.get('tokens', 0)}", file=out)
+    else:
+        print(f"❌ LLM Test Failed: {llm_test.get('error', 'unknown')}", file=out)
+
+
+def report_models(providers: dict[str, list[str]], out: io.StringIO) -> None:
+    """Print available models grouped by provider"""
+    total = sum(len(names) for names in providers.values())
+    print(f"✅ Found {total} available models", file=out)
+
+    for provider, model_names in providers.items():
+        print(f"   🏢 {provider.upper()}: {len(model_names)} models", file=out)
+
+
+class _ByteReader:
+    """Adapt an async byte iterator to the async read() ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        # Honor size: ijson probes with read(0) and discards the result
+        if size == 0:
+            return b""
+        if not self._pending:
+            self._pending = await anext(self._chunks, b"")
+        if size < 0:
+            size = len(self._pending)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+async def fetch_json(client: httpx.AsyncClient, path: str) -> tuple[int, Any]:
+    """GET an endpoint, returning its status and parsed body"""
+    response = await client.get(path)
+    if response.status_code != 200:
+        return response.status_code, None
+    return 200, response.json()
+
+
+async def fetch_grouped(
+    client: httpx.AsyncClient, path: str, key: str
+) -> tuple[int, dict[str, list[str]]]:
+    """Stream a JSON array of objects, bucketing their names by ``key``
+
+    Only the current item and the name buckets are held in memory, never the
+    whole decoded list.
+    """
+    groups: dict[str, list[str]] = {}
+    async with client.stream("GET", path) as response:
+        if response.status_code != 200:
+            return response.status_code, groups
+        reader = _ByteReader(response.aiter_bytes())
+        async for item in ijson.items(reader, "item"):
+            groups.setdefault(item.get(key, "unknown"), []).append(item["name"])
+    return 200, groups
+
+
+def _get(path: str) -> Callable[[httpx.AsyncClient], Awaitable[tuple[int, Any]]]:
+    return lambda client: fetch_json(client, path)
+
+
+def _grouped(
+    path: str, key: str
+) -> Callable[[httpx.AsyncClient], Awaitable[tuple[int, Any]]]:
+    return lambda client: fetch_grouped(client, path, key)
+
+
+# (heading, label used in failure messages, fetch, reporter), in print order
+PROBES: list[
+    tuple[
+        str,
+        str,
+        Callable[[httpx.AsyncClient], Awaitable[tuple[int, Any]]],
+        Callable[[Any, io.StringIO], None],
+    ]
+] = [
+    ("Enhanced Health Check", "Health check", _get("/health"), report_health),
+    (
+        "Integration Status",
+        "Integration test",
+        _get("/api/dev/test-integrations"),
+        report_integrations,
+    ),
+    (
+        "Tool Discovery",
+        "Tool discovery",
+        _grouped("/api/tools", "type"),
+        report_tools,
+    ),
+    (
+        "Tool Analytics",
+        "Tool analytics",
+        _get("/api/tools/analytics"),
+        report_analytics,
+    ),
+    (
+        "Enhanced Coordination",
+        "Coordination test",
+        _get("/api/coordination/status"),
+        report_coordination,
+    ),
+    ("LLM Integration", "LLM test", _get("/api/dev/test-llm"), report_llm),
+    (
+        "Available Models",
+        "Models test",
+        _grouped("/api/models", "provider"),
+        report_models,
+    ),
+]
+
+
+async def probe(
+    client: httpx.AsyncClient,
+    heading: str,
+    label: str,
+    fetch: Callable[[httpx.AsyncClient], Awaitable[tuple[int, Any]]],
+    report: Callable[[Any, io.StringIO], None],
+) -> str:
+    """Run one probe and return its report as text
+
+    Each probe writes into its own buffer so concurrent probes never
+    interleave, and the caller can emit everything in one write.
+    """
+    out = io.StringIO()
+    print(f"\n🔍 Testing {heading}...", file=out)
+    try:
+        status_code, data = await fetch(client)
+        if status_code != 200:
+            print(f"❌ {label} failed: {status_code}", file=out)
+        else:
+            report(data, out)
+    except Exception as e:
+        print(f"❌ {label} error: {e}", file=out)
+    return out.getvalue()
 
 
 async def test_enhanced_backend() -> None:
     """Test all enhanced backend capabilities"""
-    base_url = "http://127.0.0.1:8000"
-
-    async with httpx.AsyncClient() as client:
-        print("🚀 Testing Enhanced Open-Deep-Coder Backend")
-        print("=" * 60)
-
-        # Test health check with enhanced capabilities
-        print("\n🔍 Testing Enhanced Health Check...")
-        try:
-            response = await client.get(f"{base_url}/health")
-            if response.status_code == 200:
-                health_data = response.json()
-                print(f"✅ Backend Status: {health_data['status']}")
-                print("📊 Services:")
-                for service, status in health_data.get("services", {}).items():
-                    status_icon = "✅" if status else "❌"
-                    print(f"   {status_icon} {service}: {status}")
-
-                print("🎯 Enhanced Capabilities:")
-                for capability, enabled in health_data.get("capabilities", {}).items():
-                    cap_icon = "✅" if enabled else "❌"
-                    print(f"   {cap_icon} {capability}: {enabled}")
-            else:
-                print(f"❌ Health check failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Health check error: {e}")
-
-        # Test Integration Status
-        print("\n🔍 Testing Integration Status...")
-        try:
-            response = await client.get(f"{base_url}/api/dev/test-integrations")
-            if response.status_code == 200:
-                integrations = response.json()
-                print("📊 Integration Status:")
-                for integration, data in integrations.items():
-                    status_icon = "✅" if data.get("status") == "available" else "❌"
-                    print(
-                        f"   {status_icon} {integration.upper()}: {data.get('status', 'unknown')}"
-                    )
-
-                    # Show detailed info for available integrations
-                    if data.get("status") == "available":
-                        if "servers_count" in data:
-                            print(f"      📈 Servers: {data['servers_count']}")
-                        if "tools_count" in data:
-                            print(f"      🔧 Tools: {data['tools_count']}")
-                        if "workflows_count" in data:
-                            print(f"      🔄 Workflows: {data['workflows_count']}")
-                        if "sessions_count" in data:
-                            print(f"      🐛 Debug Sessions: {data['sessions_count']}")
-                        if "agents_count" in data:
-                            print(f"      🤖 Agents: {data['agents_count']}")
-            else:
-                print(f"❌ Integration test failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Integration test error: {e}")
-
-        # Test Tool Discovery
-        print("\n🔍 Testing Tool Discovery...")
-        try:
-            response = await client.get(f"{base_url}/api/tools")
-            if response.status_code == 200:
-                tools = response.json()
-                print(f"✅ Found {len(tools)} tools")
-
-                # Group tools by category
-                categories: dict[str, list[str]] = {}
-                for tool in tools:
-                    tool_type = tool["type"]
-                    if tool_type not in categories:
-                        categories[tool_type] = []
-                    categories[tool_type].append(tool["name"])
-
-                for category, tool_names in categories.items():
-                    print(f"   📦 {category.upper()}: {len(tool_names)} tools")
-                    for tool_name in tool_names[:3]:  # Show first 3 tools
-                        print(f"      - {tool_name}")
-                    if len(tool_names) > 3:
-                        print(f"      ... and {len(tool_names) - 3} more")
-
-            else:
-                print(f"❌ Tool discovery failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Tool discovery error: {e}")
-
-        # Test Tool Analytics
-        print("\n🔍 Testing Tool Analytics...")
-        try:
-            response = await client.get(f"{base_url}/api/tools/analytics")
-            if response.status_code == 200:
-                analytics = response.json()
-                print("✅ Tool Analytics:")
-                print(f"   📊 Total Tools: {analytics.get('total_tools', 0)}")
-                print(f"   🎯 Total Usages: {analytics.get('total_usages', 0)}")
-                print("   📈 By Category:")
-                for category, count in analytics.get("by_category", {}).items():
-                    print(f"      - {category}: {count}")
-            else:
-                print(f"❌ Tool analytics failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Tool analytics error: {e}")
-
-        # Test Enhanced Coordination
-        print("\n🔍 Testing Enhanced Coordination...")
-        try:
-            response = await client.get(f"{base_url}/api/coordination/status")
-            if response.status_code == 200:
-                coordination = response.json()
-                agents = coordination.get("agents", [])
-                metrics = coordination.get("metrics", {})
-
-                print("✅ Enhanced Coordination Status:")
-                print(f"   🤖 Agents: {len(agents)}")
-                print("   📊 System Metrics:")
-                print(f"      - Total Tasks: {metrics.get('total_tasks', 0)}")
-                print(f"      - Completed: {metrics.get('completed_tasks', 0)}")
-                print(f"      - Running: {metrics.get('running_tasks', 0)}")
-                print(f"      - Success Rate: {metrics.get('success_rate', 0):.2%}")
-            else:
-                print(f"❌ Coordination test failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Coordination test error: {e}")
-
-        # Test LLM Integration (if available)
-        print("\n🔍 Testing LLM Integration...")
-        try:
-            response = await client.get(f"{base_url}/api/dev/test-llm")
-            if response.status_code == 200:
-                llm_test = response.json()
-                if llm_test.get("status") == "success":
-                    print("✅ LLM Test Successful:")
-                    print(f"   🤖 Model: {llm_test.get('model_used', 'unknown')}")
-                    print(f"   💬 Response: {llm_test.get('response', '')[:100]}...")
-                    print(f"   🔢 Tokens: {llm_test.get('tokens', 0)}")
-                else:
-                    print(f"❌ LLM Test Failed: {llm_test.get('error', 'unknown')}")
-            else:
-                print(f"❌ LLM test failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ LLM test error: {e}")
-
-        # Test Available Models
-        print("\n🔍 Testing Available Models...")
-        try:
-            response = await client.get(f"{base_url}/api/models")
-            if response.status_code == 200:
-                models = response.json()
-                print(f"✅ Found {len(models)} available models")
-
-                # Group by provider
-                providers: dict[str, list[str]] = {}
-                for model in models:
-                    provider = model.get("provider", "unknown")
-                    if provider not in providers:
-                        providers[provider] = []
-                    providers[provider].append(model["name"])
-
-                for provider, model_names in providers.items():
-                    print(f"   🏢 {provider.upper()}: {len(model_names)} models")
-
-            else:
-                print(f"❌ Models test failed: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Models test error: {e}")
-
-        print("\n" + "=" * 60)
-        print("🎯 Enhanced Backend Test Complete!")
-        print("✨ Open-Deep-Coder is ready with advanced capabilities!")
+    client = await get_client()
+    try:
+        # The endpoints are independent, so hit them all at once; reports
+        # come back in PROBES order and go to stdout in a single write.
+        reports = await asyncio.gather(*(probe(client, *p) for p in PROBES))
+
+        sys.stdout.write(
+            "🚀 Testing Enhanced Open-Deep-Coder Backend\n"
+            + "=" * 60
+            + "\n"
+            + "".join(reports)
+            + "\n"
+            + "=" * 60
+            + "\n🎯 Enhanced Backend Test Complete!"
+            + "\n✨ Open-Deep-Coder is ready with advanced capabilities!\n"
+        )
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
@@ -7,19 +7,21 @@ import asyncio
 
 import httpx
 
+BASE_URL = "http://127.0.0.1:8000"
+
 
 async def test_llm_integration() -> None:
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
         # Test health endpoint
         print("🔍 Testing health endpoint...")
-        response = await client.get("http://127.0.0.1:8000/health")
+        response = await client.get("/health")
         print(f"Health status: {response.status_code}")
         print(f"Response: {response.json()}")
         print()
 
         # Test models endpoint
         print("🔍 Testing models endpoint...")
-        response = await client.get("http://127.0.0.1:8000/api/models")
+        response = await client.get("/api/models")
         print(f"Models status: {response.status_code}")
         models = response.json()
         print(f"Found {len(models)} models:")
@@ -42,9 +44,7 @@ async def test_llm_integration() -> None:
                 "model": test_model,
             }
 
-            response = await client.post(
-                "http://127.0.0.1:8000/api/chat", json=chat_request, timeout=60.0
-            )
+            response = await client.post("/api/chat", json=chat_request, timeout=60.0)
 
             print(f"Chat status: {response.status_code}")
             if response.status_code == 200:
@@ -0,0 +1,76 @@
+"""Shared pytest fixtures for the backend tests."""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+_HERE = os.path.dirname(__file__)
+TEST_SERVER_PATH = os.path.abspath(
+    os.path.join(_HERE, "..", "backend", "test_server.py")
+)
+
+
+@pytest.fixture(scope="session")
+def backend_server():
+    """backend/test_server.py, loaded by path once per test session.
+
+    Always a fresh copy: test_routellm reloads ``test_server`` with patched
+    env/state, and whatever it leaves in sys.modules must not leak in here.
+    """
+    spec = importlib.util.spec_from_file_location("test_server", TEST_SERVER_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["test_server"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def backend_main():
+    """The full backend app module, imported once.
+
+    Imported as ``backend.main`` so tests that import it directly (e.g.
+    test_health) share the same module object.
+    """
+    return importlib.import_module("backend.main")
+
+
+class FakeWS:
+    """Stand-in websocket that records what the handler sends."""
+
+    __slots__ = ("sent",)
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, obj):
+        self.sent.append(obj)
+
+
+@pytest.fixture
+def fake_ws():
+    return FakeWS()
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(backend_server):
+    """A single ASGI transport onto the test_server app, shared by the session."""
+    return ASGITransport(app=backend_server.app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_client(asgi_transport):
+    """One AsyncClient bound to the test_server app for the whole session.
+
+    Async tests default to the session loop (see ``asyncio_default_test_loop_scope``
+    in pyproject.toml), so they can all share it.
+    """
+    async with AsyncClient(
+        transport=asgi_transport, base_url="http://testserver"
+    ) as client:
+        yield client
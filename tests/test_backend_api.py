@@ -1,36 +1,55 @@
-import importlib.util
-import os
-from importlib.machinery import SourceFileLoader
-
-import pytest
-from httpx import ASGITransport, AsyncClient
-
-# Load backend/test_server.py by file path so tests can import it regardless
-# of PYTHONPATH. Use runtime checks so mypy/linters don't complain about
-# optional types returned by importlib.
-here = os.path.dirname(__file__)
-server_path = os.path.abspath(os.path.join(here, "..", "backend", "test_server.py"))
-spec = importlib.util.spec_from_loader(
-    "test_server", SourceFileLoader("test_server", server_path)
-)
-assert spec is not None and spec.loader is not None
-server = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(server)
-
-
-@pytest.mark.asyncio
-async def test_health_ok():
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        r = await client.get("/health")
-        assert r.status_code == 200
-        assert r.json().get("status") == "healthy"
-
-
-@pytest.mark.asyncio
-async def test_models_returns_list():
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        r = await client.get("/api/models")
-        assert r.status_code == 200
-        assert isinstance(r.json(), list)
+from types import SimpleNamespace
+
+
+async def test_health_ok(api_client):
+    r = await api_client.get("/health")
+    assert r.status_code == 200
+    assert r.json().get("status") == "healthy"
+
+
+async def test_models_returns_list(api_client):
+    r = await api_client.get("/api/models")
+    assert r.status_code == 200
+    assert isinstance(r.json(), list)
+
+
+async def test_chat_counts_words_when_encoding_fails(
+    api_client, backend_server, monkeypatch
+):
+    calls = []
+
+    def get_encoding(name):
+        calls.append(name)
+        raise OSError("offline")
+
+    monkeypatch.setattr(
+        backend_server, "tiktoken", SimpleNamespace(get_encoding=get_encoding)
+    )
+    backend_server._get_encoding.cache_clear()
+    backend_server.count_tokens.cache_clear()
+    try:
+        payload = {"messages": [{"role": "user", "content": "Hi"}]}
+        for _ in range(2):
+            r = await api_client.post("/api/chat", json=payload)
+            assert r.status_code == 200
+            content = r.json()["message"]["content"]
+            assert r.json()["tokens"] == len(content.split())
+        assert len(calls) == 1  # the failure is remembered, not retried
+    finally:
+        backend_server._get_encoding.cache_clear()
+        backend_server.count_tokens.cache_clear()
+
+
+async def test_lifespan_restart_gets_an_open_client(backend_server, monkeypatch):
+    # a throwaway client, so the session's shared module keeps its own
+    monkeypatch.setattr(
+        backend_server, "httpx_client", backend_server._new_httpx_client()
+    )
+
+    async with backend_server.lifespan(backend_server.app):
+        first = backend_server.httpx_client
+    assert first.is_closed
+
+    async with backend_server.lifespan(backend_server.app):
+        assert not backend_server.httpx_client.is_closed
+    assert backend_server.httpx_client.is_closed
@@ -1,40 +1,124 @@
 import os
-from importlib.machinery import SourceFileLoader
+from datetime import datetime
+from urllib.parse import unquote
 
-import pytest
-from httpx import ASGITransport, AsyncClient
 
-# Load backend/test_server
-here = os.path.dirname(__file__)
-path = os.path.abspath(os.path.join(here, "..", "backend", "test_server.py"))
-loader = SourceFileLoader("test_server", path)
-server = loader.load_module()
-
-
-@pytest.mark.asyncio
-async def test_file_write_read_delete(tmp_path):
+async def test_file_write_read_delete(api_client, tmp_path):
     """Create a file locally, read it via the test server, list the dir,
     then delete the file and confirm the server returns 404."""
 
-    transport = ASGITransport(app=server.app)
     test_file = tmp_path / "test.txt"
 
     # create file locally
     test_file.write_text("hello", encoding="utf-8")
 
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        r = await client.get("/api/files/content", params={"path": str(test_file)})
+    r = await api_client.get("/api/files/content", params={"path": str(test_file)})
+    assert r.status_code == 200
+    data = r.json()
+    assert data.get("content") == "hello"
+
+    # list directory
+    list_r = await api_client.get("/api/files", params={"path": str(tmp_path)})
+    assert list_r.status_code == 200
+    items = list_r.json()
+    assert any(it["name"] == "test.txt" for it in items)
+
+    # delete locally and confirm 404
+    test_file.unlink()
+    r2 = await api_client.get("/api/files/content", params={"path": str(test_file)})
+    assert r2.status_code == 404
+
+
+async def test_large_file_is_streamed(api_client, backend_server, tmp_path):
+    big = tmp_path / "big.txt"
+    body = "x" * (backend_server.LARGE_FILE_THRESHOLD + 1)
+    big.write_text(body, encoding="utf-8")
+
+    r = await api_client.get("/api/files/content", params={"path": str(big)})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    assert r.text == body
+    # Same path and mtime the JSON response would carry
+    assert unquote(r.headers["x-file-path"]) == os.path.abspath(big)
+    mtime = datetime.fromtimestamp(big.stat().st_mtime)
+    assert r.headers["x-file-modified"] == mtime.isoformat()
+
+
+async def test_large_multibyte_file_is_streamed(api_client, backend_server, tmp_path):
+    # 3-byte units, so chunk boundaries fall inside a character
+    big = tmp_path / "big.txt"
+    body = "xé" * (backend_server.LARGE_FILE_THRESHOLD // 3 + 1)
+    big.write_text(body, encoding="utf-8")
+
+    r = await api_client.get("/api/files/content", params={"path": str(big)})
+    assert r.status_code == 200
+    assert r.text == body
+
+
+async def test_large_binary_file_is_rejected(api_client, backend_server, tmp_path):
+    small = tmp_path / "small.bin"
+    small.write_bytes(b"\xff\xfe" * 16)
+    big = tmp_path / "big.bin"
+    big.write_bytes(b"\xff\xfe" * backend_server.LARGE_FILE_THRESHOLD)
+
+    for path in (small, big):
+        r = await api_client.get("/api/files/content", params={"path": str(path)})
+        assert r.status_code == 400
+        assert r.json()["detail"] == "File is not a text file"
+
+
+async def test_file_content_not_modified(api_client, tmp_path):
+    test_file = tmp_path / "etag.txt"
+    test_file.write_text("hello", encoding="utf-8")
+
+    r = await api_client.get("/api/files/content", params={"path": str(test_file)})
+    etag = r.headers["etag"]
+
+    r2 = await api_client.get(
+        "/api/files/content",
+        params={"path": str(test_file)},
+        headers={"If-None-Match": etag},
+    )
+    assert r2.status_code == 304
+    assert r2.content == b""
+
+
+async def test_cors_preflight_is_cacheable(api_client):
+    r = await api_client.options(
+        "/api/files/content",
+        headers={
+            "Origin": "http://localhost:1420",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "if-none-match",
+        },
+    )
+    assert r.status_code == 200
+    assert r.headers["access-control-max-age"] == "86400"
+
+
+async def test_file_errors_map_to_status(api_client, tmp_path):
+    test_file = tmp_path / "plain.txt"
+    test_file.write_text("hello", encoding="utf-8")
+
+    r = await api_client.get("/api/files/content", params={"path": str(tmp_path)})
+    assert r.status_code == 400
+
+    r = await api_client.get("/api/files", params={"path": str(test_file)})
+    assert r.status_code == 400
+
+    r = await api_client.get("/api/files", params={"path": str(tmp_path / "nope")})
+    assert r.status_code == 404
+
+
+async def test_listing_cache_is_bounded(
+    api_client, backend_server, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(backend_server, "_files_cache", {})
+    monkeypatch.setattr(backend_server, "FILES_CACHE_MAX", 2)
+    dirs = [tmp_path / name for name in ("a", "b", "c")]
+    for d in dirs:
+        d.mkdir()
+        r = await api_client.get("/api/files", params={"path": str(d)})
         assert r.status_code == 200
-        data = r.json()
-        assert data.get("content") == "hello"
-
-        # list directory
-        list_r = await client.get("/api/files", params={"path": str(tmp_path)})
-        assert list_r.status_code == 200
-        items = list_r.json()
-        assert any(it["name"] == "test.txt" for it in items)
-
-        # delete locally and confirm 404
-        test_file.unlink()
-        r2 = await client.get("/api/files/content", params={"path": str(test_file)})
-        assert r2.status_code == 404
+
+    assert list(backend_server._files_cache) == [str(d) for d in dirs[1:]]
@@ -1,15 +1,24 @@
-import asyncio
-from backend.main import startup_for_tests, health_check
+from backend.main import app, health_check, lifespan
 
 
-def test_health_direct_call():
+async def test_health_direct_call():
     """Start app lifespan and call health_check() directly."""
-    shutdown = startup_for_tests()
-    try:
-        result = asyncio.run(health_check())
+    async with lifespan(app):
+        result = await health_check()
         assert isinstance(result, dict)
         assert result.get("status") == "healthy"
         services = result.get("services", {})
         assert "llm_manager" in services
-    finally:
-        shutdown()
+
+
+async def test_health_serves_stale_payload_when_refresh_fails(monkeypatch):
+    """An expired cache entry is returned, flagged stale, if a refresh fails."""
+    import backend.main as main
+
+    def broken(state):
+        raise RuntimeError("manager crashed")
+
+    monkeypatch.setattr(main.app.state, "health_cache", (0.0, {"status": "healthy"}))
+    monkeypatch.setattr(main, "_build_health", broken)
+    result = await health_check()
+    assert result == {"status": "stale"}
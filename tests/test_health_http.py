@@ -1,4 +1,7 @@
-import requests
+import urllib3
+
+# Module-lifetime pool so any further probes reuse the keep-alive connection
+HTTP = urllib3.PoolManager(num_pools=1, maxsize=4, timeout=5.0)
 
 
 def test_health_http():
@@ -7,9 +10,8 @@ def test_health_http():
     This test expects the CI workflow to start the container with port 8000 published
     (see .github/workflows/docker-smoke.yml).
     """
-    url = "http://localhost:8000/health"
-    resp = requests.get(url, timeout=5)
-    assert resp.status_code == 200
+    resp = HTTP.request("GET", "http://localhost:8000/health", retries=False)
+    assert resp.status == 200
     data = resp.json()
     assert data.get("status") == "healthy"
     assert "services" in data
@@ -0,0 +1,89 @@
+import json
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+PAYLOAD = {"messages": [{"role": "user", "content": "Hi"}], "stream": True}
+
+
+class FakeLLM:
+    """Stand-in llm_manager whose stream yields ``chunks``, then maybe raises."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def chat_completion(self, messages, model, stream, context):
+        assert stream is True
+        return self._stream()
+
+    async def _stream(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+@pytest_asyncio.fixture(scope="module")
+async def main_client(backend_main):
+    # ASGITransport skips lifespan, so app.state has no managers until a test
+    # puts one there
+    transport = ASGITransport(app=backend_main.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+def sse_events(text):
+    """Split an SSE body into (event name, decoded data) pairs."""
+    events = []
+    for block in text.split("\n\n"):
+        if not block:
+            continue
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields.get("event", "message"), json.loads(fields["data"])))
+    return events
+
+
+async def test_chat_stream_relays_chunks_as_sse(main_client, backend_main, monkeypatch):
+    chunks = [
+        {"content": "hello ", "done": False},
+        {"content": "there", "done": False},
+        {"content": "", "done": True, "finish_reason": "stop"},
+    ]
+    monkeypatch.setattr(backend_main.app.state, "llm_manager", FakeLLM(chunks))
+
+    r = await main_client.post("/api/chat", json=PAYLOAD)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    assert r.text.startswith("data: ")
+    assert r.text.endswith("\n\n")
+    events = sse_events(r.text)
+    assert events == [("message", chunk) for chunk in chunks]
+    assert events[-1][1]["finish_reason"] == "stop"
+
+
+async def test_chat_stream_reports_upstream_failure_in_band(
+    main_client, backend_main, monkeypatch
+):
+    fake = FakeLLM([{"content": "partial"}], error=RuntimeError("upstream died"))
+    monkeypatch.setattr(backend_main.app.state, "llm_manager", fake)
+
+    r = await main_client.post("/api/chat", json=PAYLOAD)
+    assert r.status_code == 200
+    assert sse_events(r.text) == [
+        ("message", {"content": "partial"}),
+        ("error", {"error": "upstream died"}),
+    ]
+
+
+async def test_managers_are_503_before_startup(main_client, backend_main, monkeypatch):
+    monkeypatch.setattr(backend_main.app.state, "llm_manager", None)
+    monkeypatch.setattr(backend_main.app.state, "agent_manager", None)
+
+    r = await main_client.post("/api/chat", json=PAYLOAD)
+    assert r.status_code == 503
+    assert r.json()["detail"] == "LLM manager not initialized"
+
+    r = await main_client.get("/api/agents/status")
+    assert r.status_code == 503
+    assert r.json()["detail"] == "Agent manager not initialized"
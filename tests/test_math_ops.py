@@ -4,6 +4,7 @@ import pytest
 
 from src.math_ops import (
     add,
+    are_prime,
     divide,
     factorial,
     is_prime,
@@ -12,216 +13,206 @@ from src.math_ops import (
     subtract,
 )
 
+# Reference primality for 0..SIEVE_LIMIT-1, from an independent sieve so the
+# is_prime cases don't have to be listed by hand.
+SIEVE_LIMIT = 200
+_sieve = bytearray([1]) * SIEVE_LIMIT
+_sieve[:2] = b"\x00\x00"
+for _i in range(2, int(SIEVE_LIMIT**0.5) + 1):
+    if _sieve[_i]:
+        _sieve[_i * _i :: _i] = bytes(len(range(_i * _i, SIEVE_LIMIT, _i)))
+PRIMES = [n for n in range(SIEVE_LIMIT) if _sieve[n]]
+COMPOSITES = [n for n in range(2, SIEVE_LIMIT) if not _sieve[n]]
+
 
 class TestAdd:
     """Test cases for the add function."""
 
-    def test_add_positive_integers(self):
-        """Test adding positive integers."""
-        assert add(2, 3) == 5
-        assert add(10, 20) == 30
-
-    def test_add_negative_integers(self):
-        """Test adding negative integers."""
-        assert add(-2, -3) == -5
-        assert add(-10, 5) == -5
-
-    def test_add_floats(self):
-        """Test adding floating point numbers."""
-        assert add(2.5, 1.5) == 4.0
-        assert add(1.1, 2.2) == pytest.approx(3.3)
-
-    def test_add_mixed_types(self):
-        """Test adding integer and float."""
-        assert add(2, 1.5) == 3.5
-        assert add(3.5, 2) == 5.5
-
-    def test_add_zero(self):
-        """Test adding zero."""
-        assert add(5, 0) == 5
-        assert add(0, 5) == 5
-        assert add(0, 0) == 0
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (2, 3, 5),
+            (10, 20, 30),
+            (-2, -3, -5),
+            (-10, 5, -5),
+            (2.5, 1.5, 4.0),
+            (1.1, 2.2, pytest.approx(3.3)),
+            (2, 1.5, 3.5),
+            (3.5, 2, 5.5),
+            (5, 0, 5),
+            (0, 5, 5),
+            (0, 0, 0),
+        ],
+    )
+    def test_add(self, a, b, expected):
+        """Test adding integers, floats, mixed types and zero."""
+        assert add(a, b) == expected
 
 
 class TestSubtract:
     """Test cases for the subtract function."""
 
-    def test_subtract_positive_integers(self):
-        """Test subtracting positive integers."""
-        assert subtract(5, 3) == 2
-        assert subtract(10, 4) == 6
-
-    def test_subtract_negative_result(self):
-        """Test subtraction resulting in negative number."""
-        assert subtract(3, 5) == -2
-        assert subtract(-5, -3) == -2
-
-    def test_subtract_floats(self):
-        """Test subtracting floating point numbers."""
-        assert subtract(2.5, 1.5) == 1.0
-        assert subtract(3.7, 1.2) == pytest.approx(2.5)
-
-    def test_subtract_zero(self):
-        """Test subtracting zero."""
-        assert subtract(5, 0) == 5
-        assert subtract(0, 5) == -5
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (5, 3, 2),
+            (10, 4, 6),
+            (3, 5, -2),
+            (-5, -3, -2),
+            (2.5, 1.5, 1.0),
+            (3.7, 1.2, pytest.approx(2.5)),
+            (5, 0, 5),
+            (0, 5, -5),
+        ],
+    )
+    def test_subtract(self, a, b, expected):
+        """Test subtracting integers, floats and zero."""
+        assert subtract(a, b) == expected
 
 
 class TestMultiply:
     """Test cases for the multiply function."""
 
-    def test_multiply_positive_integers(self):
-        """Test multiplying positive integers."""
-        assert multiply(2, 3) == 6
-        assert multiply(4, 5) == 20
-
-    def test_multiply_negative_integers(self):
-        """Test multiplying negative integers."""
-        assert multiply(-2, 3) == -6
-        assert multiply(-2, -3) == 6
-
-    def test_multiply_floats(self):
-        """Test multiplying floating point numbers."""
-        assert multiply(2.5, 2) == 5.0
-        assert multiply(1.5, 2.5) == pytest.approx(3.75)
-
-    def test_multiply_by_zero(self):
-        """Test multiplying by zero."""
-        assert multiply(5, 0) == 0
-        assert multiply(0, 5) == 0
-        assert multiply(0, 0) == 0
-
-    def test_multiply_by_one(self):
-        """Test multiplying by one."""
-        assert multiply(5, 1) == 5
-        assert multiply(1, 5) == 5
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (2, 3, 6),
+            (4, 5, 20),
+            (-2, 3, -6),
+            (-2, -3, 6),
+            (2.5, 2, 5.0),
+            (1.5, 2.5, pytest.approx(3.75)),
+            (5, 0, 0),
+            (0, 5, 0),
+            (0, 0, 0),
+            (5, 1, 5),
+            (1, 5, 5),
+        ],
+    )
+    def test_multiply(self, a, b, expected):
+        """Test multiplying integers, floats, zero and one."""
+        assert multiply(a, b) == expected
 
 
 class TestDivide:
     """Test cases for the divide function."""
 
-    def test_divide_positive_integers(self):
-        """Test dividing positive integers."""
-        assert divide(6, 2) == 3.0
-        assert divide(10, 4) == 2.5
-
-    def test_divide_negative_integers(self):
-        """Test dividing negative integers."""
-        assert divide(-6, 2) == -3.0
-        assert divide(-6, -2) == 3.0
-
-    def test_divide_floats(self):
-        """Test dividing floating point numbers."""
-        assert divide(5.0, 2.0) == 2.5
-        assert divide(7.5, 2.5) == 3.0
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (6, 2, 3.0),
+            (10, 4, 2.5),
+            (-6, 2, -3.0),
+            (-6, -2, 3.0),
+            (5.0, 2.0, 2.5),
+            (7.5, 2.5, 3.0),
+            (0, 5, 0.0),
+            (0, 2.5, 0.0),
+        ],
+    )
+    def test_divide(self, a, b, expected):
+        """Test dividing integers, floats and zero."""
+        assert divide(a, b) == expected
 
     def test_divide_by_zero(self):
         """Test dividing by zero raises ZeroDivisionError."""
         with pytest.raises(ZeroDivisionError, match="Cannot divide by zero"):
             divide(5, 0)
 
-    def test_divide_zero_by_number(self):
-        """Test dividing zero by a number."""
-        assert divide(0, 5) == 0.0
-        assert divide(0, 2.5) == 0.0
-
 
 class TestPower:
     """Test cases for the power function."""
 
-    def test_power_positive_integers(self):
-        """Test raising positive integers to powers."""
-        assert power(2, 3) == 8
-        assert power(3, 2) == 9
-        assert power(5, 0) == 1
-
-    def test_power_negative_base(self):
-        """Test raising negative base to powers."""
-        assert power(-2, 2) == 4
-        assert power(-2, 3) == -8
-
-    def test_power_fractional_exponent(self):
-        """Test raising to fractional powers."""
-        assert power(4, 0.5) == 2.0
-        assert power(8, 1 / 3) == pytest.approx(2.0)
-
-    def test_power_zero_base(self):
-        """Test raising zero to powers."""
-        assert power(0, 5) == 0
-        assert power(0, 2.5) == 0
-
-    def test_power_one_base(self):
-        """Test raising one to powers."""
-        assert power(1, 5) == 1
-        assert power(1, 100) == 1
+    @pytest.mark.parametrize(
+        "base, exponent, expected",
+        [
+            (2, 3, 8),
+            (3, 2, 9),
+            (5, 0, 1),
+            (-2, 2, 4),
+            (-2, 3, -8),
+            (4, 0.5, 2.0),
+            (8, 1 / 3, pytest.approx(2.0)),
+            (0, 5, 0),
+            (0, 2.5, 0),
+            (1, 5, 1),
+            (1, 100, 1),
+        ],
+    )
+    def test_power(self, base, exponent, expected):
+        """Test integer, negative, fractional, zero and one bases."""
+        assert power(base, exponent) == expected
 
 
 class TestFactorial:
     """Test cases for the factorial function."""
 
-    def test_factorial_positive_integers(self):
-        """Test factorial of positive integers."""
-        assert factorial(0) == 1
-        assert factorial(1) == 1
-        assert factorial(5) == 120
-        assert factorial(6) == 720
+    @pytest.mark.parametrize(
+        "n, expected", [(0, 1), (1, 1), (5, 120), (6, 720), (10, 3628800)]
+    )
+    def test_factorial(self, n, expected):
+        """Test factorial of non-negative integers."""
+        assert factorial(n) == expected
 
-    def test_factorial_negative_number(self):
+    @pytest.mark.parametrize("n", [-1, -5])
+    def test_factorial_negative_number(self, n):
         """Test factorial of negative number raises ValueError."""
         with pytest.raises(ValueError, match="non-negative integers"):
-            factorial(-1)
-        with pytest.raises(ValueError, match="non-negative integers"):
-            factorial(-5)
+            factorial(n)
 
-    def test_factorial_non_integer(self):
+    @pytest.mark.parametrize("n", [2.5, "5"])
+    def test_factorial_non_integer(self, n):
         """Test factorial of non-integer raises TypeError."""
         with pytest.raises(TypeError, match="only defined for integers"):
-            factorial(2.5)
-        with pytest.raises(TypeError, match="only defined for integers"):
-            factorial("5")
-
-    def test_factorial_large_number(self):
-        """Test factorial of larger numbers."""
-        assert factorial(10) == 3628800
+            factorial(n)
 
 
 class TestIsPrime:
     """Test cases for the is_prime function."""
 
-    def test_is_prime_small_primes(self):
-        """Test small prime numbers."""
-        assert is_prime(2) is True
-        assert is_prime(3) is True
-        assert is_prime(5) is True
-        assert is_prime(7) is True
-        assert is_prime(11) is True
-
-    def test_is_prime_small_composites(self):
-        """Test small composite numbers."""
-        assert is_prime(4) is False
-        assert is_prime(6) is False
-        assert is_prime(8) is False
-        assert is_prime(9) is False
-        assert is_prime(10) is False
-
-    def test_is_prime_edge_cases(self):
-        """Test edge cases."""
-        assert is_prime(0) is False
-        assert is_prime(1) is False
-        assert is_prime(-5) is False
-
-    def test_is_prime_larger_numbers(self):
-        """Test larger prime and composite numbers."""
-        assert is_prime(97) is True  # Large prime
-        assert is_prime(100) is False  # Large composite
-        assert is_prime(101) is True  # Large prime
-
-    def test_is_prime_non_integer(self):
+    @pytest.mark.parametrize("n", PRIMES)
+    def test_is_prime_primes(self, n):
+        """Test prime numbers."""
+        assert is_prime(n) is True
+
+    @pytest.mark.parametrize("n", COMPOSITES)
+    def test_is_prime_composites(self, n):
+        """Test composite numbers."""
+        assert is_prime(n) is False
+
+    @pytest.mark.parametrize("n", [-5, 0, 1])
+    def test_is_prime_edge_cases(self, n):
+        """Test numbers below 2."""
+        assert is_prime(n) is False
+
+    @pytest.mark.parametrize("n", [2.5, "7"])
+    def test_is_prime_non_integer(self, n):
         """Test is_prime with non-integer raises TypeError."""
         with pytest.raises(TypeError, match="only defined for integers"):
-            is_prime(2.5)
+            is_prime(n)
+
+
+class TestArePrime:
+    """Test cases for the are_prime function."""
+
+    def test_are_prime_matches_is_prime(self):
+        """Test the sieve agrees with is_prime across a range."""
+        ns = list(range(-5, 500))
+        assert are_prime(ns) == [is_prime(n) for n in ns]
+
+    def test_are_prime_large_values_skip_the_sieve(self):
+        """Test values past the sieve cap are checked without sieving to them."""
+        big_prime = 10**12 + 39
+        assert are_prime([7, 10**12, big_prime, 9]) == [True, False, True, False]
+
+    def test_are_prime_empty(self):
+        """Test an empty batch."""
+        assert are_prime([]) == []
+
+    def test_are_prime_non_integer(self):
+        """Test are_prime with non-integer raises TypeError."""
         with pytest.raises(TypeError, match="only defined for integers"):
-            is_prime("7")
+            are_prime([2, 2.5])
 
 
 # Integration tests
@@ -253,8 +244,7 @@ class TestMathOpsIntegration:
             add(factorial(2.5), 5)
 
 
-# Performance tests (marked as slow)
-@pytest.mark.slow
+# Performance tests
 class TestMathOpsPerformance:
     """Performance tests for math operations."""
 
@@ -270,3 +260,16 @@ class TestMathOpsPerformance:
         assert is_prime(7919) is True
         # Test with a known large composite
         assert is_prime(7920) is False
+
+    def test_is_prime_large_numbers(self):
+        """Test is_prime on inputs far beyond trial-division range."""
+        assert is_prime(2**61 - 1) is True  # Mersenne prime
+        assert is_prime(3215031751) is False  # strong pseudoprime to bases 2-7
+        assert is_prime(561) is False  # Carmichael number
+        # 399165290221 * 798330580441, strong pseudoprime to bases 2-37
+        assert is_prime(318665857834031151167461) is False
+        # psi_13 = 1287836182261 * 2575672364521, strong pseudoprime to 2-41
+        assert is_prime(3317044064679887385961981) is False
+        assert is_prime(2**89 - 1) is True  # Mersenne primes past psi_13
+        assert is_prime(2**127 - 1) is True
+        assert is_prime((2**89 - 1) * (2**61 - 1)) is False
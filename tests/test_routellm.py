@@ -1,151 +1,137 @@
+import importlib.util
 import os
 import sys
-from importlib.machinery import SourceFileLoader
-from types import SimpleNamespace
+import time
+from dataclasses import dataclass
+from types import ModuleType
 from typing import Any
 
+import orjson
 import pytest
-
-
-class FakeResp:
-    def __init__(self, status_code=200, data=None):
-        self.status_code = status_code
-        self._data = data or {}
-
-    def json(self):
-        return self._data
-
-
-async def async_noop(*args, **kwargs):
-    raise RuntimeError("no network")
-
-
-def reload_server_with_env(env: dict) -> Any:
-    # Ensure a fresh import of test_server with the provided env vars
-    for k, v in env.items():
-        if v is None and k in os.environ:
-            del os.environ[k]
-        elif v is not None:
-            os.environ[k] = v
-
-    # load by path to ensure we get the file in repo root
-    if "test_server" in sys.modules:
-        del sys.modules["test_server"]
-    path = os.path.join(os.getcwd(), "backend", "test_server.py")
-    loader = SourceFileLoader("test_server", path)
-    module = loader.load_module()
-    sys.modules["test_server"] = module
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+# Upstream calls made through the server's real httpx_client are answered by
+# respx's ``respx_mock`` fixture; any request without a route raises, which
+# the server treats like an unreachable provider. The ASGI client below is
+# not routed through respx.
+OLLAMA_TAGS = "http://ollama.local/api/tags"
+OLLAMA_CHAT = "http://ollama.local/api/chat"
+OPENROUTER_MODELS = "https://openrouter.ai/api/v1/models"
+OPENROUTER_CHAT = "https://openrouter.ai/api/v1/chat/completions"
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@dataclass(slots=True)
+class MockModel:
+    # the attributes the chat handler reads off an LLMModel
+    id: str
+    name: str
+    provider: str
+    context_length: int
+    is_available: bool = True
+
+
+# Seeded straight into _models_cache; built once at import
+OLLAMA_MOCK = MockModel(
+    id="ollama-1", name="ollama-1", provider="ollama", context_length=4096
+)
+
+
+def respond_json(route, body):
+    # bodies are encoded once with orjson rather than by respx's json= per call
+    return route.respond(200, content=orjson.dumps(body), headers=JSON_HEADERS)
+
+
+# resolved once, relative to this file rather than the working directory
+_SERVER_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "backend", "test_server.py")
+)
+
+# test_server reads its config at import time, so each distinct env needs its
+# own load; repeat envs reuse the module instead of re-executing the file.
+_SERVER_CACHE: dict[frozenset, ModuleType] = {}
+
+
+def reload_server_with_env(monkeypatch, env: dict) -> Any:
+    # Import test_server with the provided env vars (None unsets), once per env
+    key = frozenset(env.items())
+    module = _SERVER_CACHE.get(key)
+    if module is None:
+        for k, v in env.items():
+            if v is None:
+                monkeypatch.delenv(k, raising=False)
+            else:
+                monkeypatch.setenv(k, v)
+
+        # the name is unique per env and per xdist worker so copies never
+        # share a sys.modules entry
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        name = f"test_server_{worker}_{len(_SERVER_CACHE)}"
+        spec = importlib.util.spec_from_file_location(name, _SERVER_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _SERVER_CACHE[key] = module
     return module
 
 
-@pytest.mark.asyncio
-async def test_models_prefer_ollama(monkeypatch):
-    server = reload_server_with_env(
-        {"OPENROUTER_API_KEY": None, "OLLAMA_BASE_URL": "http://ollama.local"}
-    )
-
-    async def fake_get(url, *args, **kwargs):
-        if url.startswith("http://ollama.local"):
-            return FakeResp(200, {"models": [{"name": "llama2"}]})
-        return FakeResp(404, {})
-
-    monkeypatch.setattr(
-        server, "httpx_client", SimpleNamespace(get=fake_get, post=async_noop)
-    )
-
-    # call endpoint
-    from httpx import ASGITransport, AsyncClient
-
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        r = await client.get("/api/models")
-        assert r.status_code == 200
-        models = r.json()
-        assert any(m.get("provider") == "ollama" for m in models)
-
-
-@pytest.mark.asyncio
-async def test_models_include_openrouter_when_key_set(monkeypatch):
-    server = reload_server_with_env(
-        {"OPENROUTER_API_KEY": "key123", "OLLAMA_BASE_URL": "http://ollama.local"}
-    )
-
-    async def fake_get(url, *args, **kwargs):
-        if "openrouter.ai" in url:
-            return FakeResp(
-                200, {"data": [{"id": "open:1", "context_length": 4096, "name": "or"}]}
-            )
-        return FakeResp(404, {})
-
-    monkeypatch.setattr(
-        server, "httpx_client", SimpleNamespace(get=fake_get, post=async_noop)
-    )
-
-    from httpx import ASGITransport, AsyncClient
-
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        r = await client.get("/api/models")
-        assert r.status_code == 200
-        models = r.json()
-        assert any(m.get("provider") == "openrouter" for m in models)
-
-
-@pytest.mark.asyncio
-async def test_chat_routes_to_ollama(monkeypatch):
-    server = reload_server_with_env({"OPENROUTER_API_KEY": None})
-
-    # Pre-populate mock models with an Ollama model object (SimpleNamespace to mimic object)
-    server.mock_models = [
-        SimpleNamespace(
-            id="ollama-1",
-            name="ollama-1",
-            provider="ollama",
-            context_length=4096,
-            is_available=True,
-        )
-    ]
-
-    async def fake_post(url, *args, **kwargs):
-        if "ollama" in url:
-            return FakeResp(200, {"message": {"content": "hello from ollama"}})
-        raise RuntimeError("unexpected post")
-
-    monkeypatch.setattr(
-        server, "httpx_client", SimpleNamespace(get=async_noop, post=fake_post)
-    )
-
-    from httpx import ASGITransport, AsyncClient
-
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        payload = {"messages": [{"role": "user", "content": "Hi"}], "model": "ollama-1"}
-        r = await client.post("/api/chat", json=payload)
-        assert r.status_code == 200
-        data = r.json()
-        assert data.get("context", {}).get("provider") == "ollama"
-        assert "ollama" in data.get("message", {}).get("content", "").lower()
-
-
-@pytest.mark.asyncio
-async def test_chat_routes_to_openrouter(monkeypatch):
-    server = reload_server_with_env({"OPENROUTER_API_KEY": "key123"})
-
-    server.mock_models = [
-        SimpleNamespace(
-            id="open:1",
-            name="open:1",
-            provider="openrouter",
-            context_length=4096,
-            is_available=True,
-        )
-    ]
-
-    async def fake_post(url, *args, **kwargs):
-        if "openrouter.ai" in url:
-            return FakeResp(
-                200,
-                {
+OLLAMA_ONLY = {"OPENROUTER_API_KEY": None, "OLLAMA_BASE_URL": "http://ollama.local"}
+WITH_OPENROUTER = {
+    "OPENROUTER_API_KEY": "key123",
+    "OLLAMA_BASE_URL": "http://ollama.local",
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[OLLAMA_ONLY, WITH_OPENROUTER],
+    ids=["ollama_only", "with_openrouter"],
+)
+def server_mod(request):
+    # Every test runs against both configs unless it parametrizes server_mod
+    # itself; pytest groups tests by param, so each env is loaded once. The env
+    # is only read at import, so it is restored as soon as the module is loaded.
+    with pytest.MonkeyPatch.context() as mp:
+        return reload_server_with_env(mp, request.param)
+
+
+@pytest.fixture
+def server(server_mod):
+    # drop whatever model list a previous test left in the shared module
+    server_mod._models_cache = None
+    return server_mod
+
+
+# Most tests await the route handlers directly; the client is for the ones
+# that need the real request/response path.
+@pytest_asyncio.fixture(scope="module")
+async def client(server_mod):
+    transport = ASGITransport(app=server_mod.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+@pytest.mark.parametrize(
+    "server_mod,get_map,post_map,model_id,provider",
+    [
+        (
+            OLLAMA_ONLY,
+            {OLLAMA_TAGS: {"models": [{"name": "llama2"}]}},
+            {OLLAMA_CHAT: {"message": {"content": "hello from ollama"}}},
+            "llama2",
+            "ollama",
+        ),
+        (
+            WITH_OPENROUTER,
+            {
+                OPENROUTER_MODELS: {
+                    "data": [{"id": "open:1", "context_length": 4096, "name": "or"}]
+                }
+            },
+            {
+                OPENROUTER_CHAT: {
                     "choices": [
                         {
                             "message": {"content": "hello from openrouter"},
@@ -153,41 +139,84 @@ async def test_chat_routes_to_openrouter(monkeypatch):
                         }
                     ],
                     "usage": {"total_tokens": 5},
-                },
-            )
-        raise RuntimeError("unexpected post")
-
-    monkeypatch.setattr(
-        server, "httpx_client", SimpleNamespace(get=async_noop, post=fake_post)
+                }
+            },
+            "open:1",
+            "openrouter",
+        ),
+    ],
+    indirect=["server_mod"],
+    ids=["ollama", "openrouter"],
+)
+async def test_models_and_chat_route_by_provider(
+    server, respx_mock, get_map, post_map, model_id, provider
+):
+    for url, body in get_map.items():
+        respond_json(respx_mock.get(url), body)
+    for url, body in post_map.items():
+        respond_json(respx_mock.post(url), body)
+
+    models = await server.get_available_models_endpoint()
+    assert any(m.id == model_id and m.provider == provider for m in models)
+
+    payload = {"messages": [{"role": "user", "content": "Hi"}], "model": model_id}
+    data = await server.chat_completion(server.ChatRequest(**payload))
+    assert data.context.get("provider") == provider
+    assert provider in data.message.content.lower()
+
+
+async def test_chat_fallback_when_providers_fail(server, respx_mock):
+    # No routes: every upstream call fails, so chat falls back to the mock
+    payload = {"messages": [{"role": "user", "content": "Test fallback"}]}
+    data = await server.chat_completion(server.ChatRequest(**payload))
+    assert data.context.get("provider") == "mock"
+
+
+async def test_models_cached_within_ttl(server, respx_mock):
+    tags = respond_json(respx_mock.get(OLLAMA_TAGS), {"models": [{"name": "llama2"}]})
+
+    await server.get_available_models_endpoint()
+    await server.get_available_models_endpoint()
+    assert tags.call_count == 1
+
+    # an expired entry triggers a refresh
+    fetched_at, models, models_by_id = server._models_cache
+    server._models_cache = (fetched_at - server.MODELS_TTL, models, models_by_id)
+    await server.get_available_models_endpoint()
+    assert tags.call_count == 2
+
+
+async def test_chat_streams_ollama(server, client, respx_mock):
+    # goes through the ASGI app so the route and SSE framing stay covered
+    server._models_cache = (
+        time.monotonic(),
+        [OLLAMA_MOCK],
+        {OLLAMA_MOCK.id: OLLAMA_MOCK},
     )
 
-    from httpx import ASGITransport, AsyncClient
-
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        payload = {"messages": [{"role": "user", "content": "Hi"}], "model": "open:1"}
-        r = await client.post("/api/chat", json=payload)
-        assert r.status_code == 200
-        data = r.json()
-        assert data.get("context", {}).get("provider") == "openrouter"
-
-
-@pytest.mark.asyncio
-async def test_chat_fallback_when_providers_fail(monkeypatch):
-    server = reload_server_with_env({"OPENROUTER_API_KEY": None})
-
-    # Ensure no models and post raises
-    server.mock_models = []
-    monkeypatch.setattr(
-        server, "httpx_client", SimpleNamespace(get=async_noop, post=async_noop)
+    lines = [
+        {"message": {"content": "hello "}, "done": False},
+        {"message": {"content": "there"}, "done": False},
+        {"message": {"content": ""}, "done": True},
+    ]
+    chat = respx_mock.post(OLLAMA_CHAT).respond(
+        200, content=b"".join(orjson.dumps(line) + b"\n" for line in lines)
     )
 
-    from httpx import ASGITransport, AsyncClient
-
-    transport = ASGITransport(app=server.app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-        payload = {"messages": [{"role": "user", "content": "Test fallback"}]}
-        r = await client.post("/api/chat", json=payload)
-        assert r.status_code == 200
-        data = r.json()
-        assert data.get("context", {}).get("provider") == "mock"
+    payload = {
+        "messages": [{"role": "user", "content": "Hi"}],
+        "model": "ollama-1",
+        "stream": True,
+    }
+    r = await client.post("/api/chat", json=payload)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    assert orjson.loads(chat.calls.last.request.content)["stream"] is True
+    events = [
+        orjson.loads(line[len("data: ") :])
+        for line in r.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [e["content"] for e in events[:-1]] == ["hello ", "there"]
+    assert events[-1]["message"]["content"] == "hello there"
+    assert events[-1]["tokens"] == 2